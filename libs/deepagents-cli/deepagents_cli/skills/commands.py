@@ -7,6 +7,7 @@ These commands are registered with the CLI via cli.py:
 """
 
 import argparse
+import os
 import re
 from pathlib import Path
 from typing import Any
@@ -16,6 +17,9 @@ from deepagents_cli.skills.load import list_skills
 
 MAX_SKILL_NAME_LENGTH = 64
 
+# Spec: lowercase alphanumeric and hyphens only; no start/end or consecutive hyphens
+_SKILL_NAME_RE = re.compile(r"[a-z0-9]+(?:-[a-z0-9]+)*")
+
 
 def _validate_name(name: str) -> tuple[bool, str]:
     """Validate name per Agent Skills spec.
@@ -46,8 +50,9 @@ def _validate_name(name: str) -> tuple[bool, str]:
         return False, "cannot contain path components"
 
     # Spec: lowercase alphanumeric and hyphens only
-    # Pattern ensures: no start/end hyphen, no consecutive hyphens
-    if not re.match(r"^[a-z0-9]+(-[a-z0-9]+)*$", name):
+    # Pattern ensures: no start/end hyphen, no consecutive hyphens. fullmatch
+    # (unlike a $ anchor) also rejects a trailing newline.
+    if not _SKILL_NAME_RE.fullmatch(name):
         return (
             False,
             "must be lowercase letters, numbers, and hyphens only "
@@ -67,22 +72,26 @@ def _validate_skill_path(skill_dir: Path, base_dir: Path) -> tuple[bool, str]:
     Returns:
         Tuple of (is_valid, error_message). If valid, error_message is empty.
     """
+    # A new entry directly under base_dir can't lead anywhere else, so only
+    # existing paths need resolving. "." and ".." are excluded since they point
+    # at base_dir or above it even when base_dir doesn't exist yet. lexists also
+    # sees dangling symlinks, which still have to be resolved to find where they
+    # point.
+    if (
+        skill_dir.parent == base_dir
+        and skill_dir.name not in {"", ".", ".."}
+        and not os.path.lexists(skill_dir)
+    ):
+        return True, ""
+
     try:
         # Resolve both paths to their canonical form
         resolved_skill = skill_dir.resolve()
         resolved_base = base_dir.resolve()
 
         # Check if skill_dir is within base_dir
-        # Use is_relative_to if available (Python 3.9+), otherwise use string comparison
-        if hasattr(resolved_skill, "is_relative_to"):
-            if not resolved_skill.is_relative_to(resolved_base):
-                return False, f"Skill directory must be within {base_dir}"
-        else:
-            # Fallback for older Python versions
-            try:
-                resolved_skill.relative_to(resolved_base)
-            except ValueError:
-                return False, f"Skill directory must be within {base_dir}"
+        if not resolved_skill.is_relative_to(resolved_base):
+            return False, f"Skill directory must be within {base_dir}"
 
         return True, ""
     except (OSError, RuntimeError) as e:
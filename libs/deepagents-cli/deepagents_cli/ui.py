@@ -1,11 +1,16 @@
 """UI rendering and display utilities for the CLI."""
 
 import json
+from collections.abc import Callable
+from functools import partial
 from pathlib import Path
 from typing import Any
 
 from .config import COLORS, DEEP_AGENTS_ASCII, MAX_ARG_LENGTH, console
 
+_GENERIC_ARG_MAX_LENGTH = 50
+"""Max length of each argument value in the generic key=value tool display."""
+
 
 def truncate_value(value: str, max_length: int = MAX_ARG_LENGTH) -> str:
     """Truncate a string value if it exceeds max_length."""
@@ -14,6 +19,101 @@ def truncate_value(value: str, max_length: int = MAX_ARG_LENGTH) -> str:
     return value
 
 
+def _abbreviate_path(path_str: str, max_length: int = 60) -> str:
+    """Abbreviate a file path intelligently - show basename or relative path."""
+    try:
+        path = Path(path_str)
+
+        # If it's just a filename (no directory parts), return as-is
+        if len(path.parts) == 1:
+            return path_str
+
+        # Try to get relative path from current working directory
+        try:
+            rel_path = path.relative_to(Path.cwd())
+            rel_str = str(rel_path)
+            # Use relative if it's shorter and not too long
+            if len(rel_str) < len(path_str) and len(rel_str) <= max_length:
+                return rel_str
+        except (ValueError, Exception):
+            pass
+
+        # If absolute path is reasonable length, use it
+        if len(path_str) <= max_length:
+            return path_str
+
+        # Otherwise, just show basename (filename only)
+        return path.name
+    except Exception:
+        # Fallback to original string if any error
+        return truncate_value(path_str, max_length)
+
+
+# Tool-specific formatters return None when the expected argument is missing, in
+# which case the generic key=value formatting is used instead.
+
+
+def _format_file_op(tool_name: str, tool_args: dict) -> str | None:
+    """File operations: show the primary file path argument (file_path or path)."""
+    path_value = tool_args.get("file_path")
+    if path_value is None:
+        path_value = tool_args.get("path")
+    if path_value is None:
+        return None
+    return f"{tool_name}({_abbreviate_path(str(path_value))})"
+
+
+def _format_quoted_arg(tool_name: str, tool_args: dict, *, key: str, max_length: int) -> str | None:
+    """Show a single argument as a quoted, truncated string."""
+    if key not in tool_args:
+        return None
+    return f'{tool_name}("{truncate_value(str(tool_args[key]), max_length)}")'
+
+
+def _format_ls(tool_name: str, tool_args: dict) -> str:
+    """Ls: show directory, or empty if current directory."""
+    if tool_args.get("path"):
+        return f"{tool_name}({_abbreviate_path(str(tool_args['path']))})"
+    return f"{tool_name}()"
+
+
+def _format_http_request(tool_name: str, tool_args: dict) -> str | None:
+    """HTTP: show method and URL."""
+    parts = []
+    if "method" in tool_args:
+        parts.append(str(tool_args["method"]).upper())
+    if "url" in tool_args:
+        parts.append(truncate_value(str(tool_args["url"]), 80))
+    if not parts:
+        return None
+    return f"{tool_name}({' '.join(parts)})"
+
+
+def _format_write_todos(tool_name: str, tool_args: dict) -> str | None:
+    """Todos: show count of items."""
+    todos = tool_args.get("todos")
+    if not isinstance(todos, list):
+        return None
+    return f"{tool_name}({len(todos)} items)"
+
+
+_TOOL_DISPLAY_FORMATTERS: dict[str, Callable[[str, dict], str | None]] = {
+    "read_file": _format_file_op,
+    "write_file": _format_file_op,
+    "edit_file": _format_file_op,
+    "web_search": partial(_format_quoted_arg, key="query", max_length=100),
+    "grep": partial(_format_quoted_arg, key="pattern", max_length=70),
+    "shell": partial(_format_quoted_arg, key="command", max_length=120),
+    "ls": _format_ls,
+    "glob": partial(_format_quoted_arg, key="pattern", max_length=80),
+    "http_request": _format_http_request,
+    "fetch_url": partial(_format_quoted_arg, key="url", max_length=80),
+    "task": partial(_format_quoted_arg, key="description", max_length=100),
+    "write_todos": _format_write_todos,
+}
+"""Tool-specific display formatters, keyed by tool name."""
+
+
 def format_tool_display(tool_name: str, tool_args: dict) -> str:
     """Format tool calls for display with tool-specific smart formatting.
 
@@ -31,134 +131,42 @@ def format_tool_display(tool_name: str, tool_args: dict) -> str:
         web_search(query="how to code", max_results=5) → 'web_search("how to code")'
         shell(command="pip install foo") → 'shell("pip install foo")'
     """
-
-    def abbreviate_path(path_str: str, max_length: int = 60) -> str:
-        """Abbreviate a file path intelligently - show basename or relative path."""
-        try:
-            path = Path(path_str)
-
-            # If it's just a filename (no directory parts), return as-is
-            if len(path.parts) == 1:
-                return path_str
-
-            # Try to get relative path from current working directory
-            try:
-                rel_path = path.relative_to(Path.cwd())
-                rel_str = str(rel_path)
-                # Use relative if it's shorter and not too long
-                if len(rel_str) < len(path_str) and len(rel_str) <= max_length:
-                    return rel_str
-            except (ValueError, Exception):
-                pass
-
-            # If absolute path is reasonable length, use it
-            if len(path_str) <= max_length:
-                return path_str
-
-            # Otherwise, just show basename (filename only)
-            return path.name
-        except Exception:
-            # Fallback to original string if any error
-            return truncate_value(path_str, max_length)
-
     # Tool-specific formatting - show the most important argument(s)
-    if tool_name in ("read_file", "write_file", "edit_file"):
-        # File operations: show the primary file path argument (file_path or path)
-        path_value = tool_args.get("file_path")
-        if path_value is None:
-            path_value = tool_args.get("path")
-        if path_value is not None:
-            path = abbreviate_path(str(path_value))
-            return f"{tool_name}({path})"
-
-    elif tool_name == "web_search":
-        # Web search: show the query string
-        if "query" in tool_args:
-            query = str(tool_args["query"])
-            query = truncate_value(query, 100)
-            return f'{tool_name}("{query}")'
-
-    elif tool_name == "grep":
-        # Grep: show the search pattern
-        if "pattern" in tool_args:
-            pattern = str(tool_args["pattern"])
-            pattern = truncate_value(pattern, 70)
-            return f'{tool_name}("{pattern}")'
-
-    elif tool_name == "shell":
-        # Shell: show the command being executed
-        if "command" in tool_args:
-            command = str(tool_args["command"])
-            command = truncate_value(command, 120)
-            return f'{tool_name}("{command}")'
-
-    elif tool_name == "ls":
-        # ls: show directory, or empty if current directory
-        if tool_args.get("path"):
-            path = abbreviate_path(str(tool_args["path"]))
-            return f"{tool_name}({path})"
-        return f"{tool_name}()"
-
-    elif tool_name == "glob":
-        # Glob: show the pattern
-        if "pattern" in tool_args:
-            pattern = str(tool_args["pattern"])
-            pattern = truncate_value(pattern, 80)
-            return f'{tool_name}("{pattern}")'
-
-    elif tool_name == "http_request":
-        # HTTP: show method and URL
-        parts = []
-        if "method" in tool_args:
-            parts.append(str(tool_args["method"]).upper())
-        if "url" in tool_args:
-            url = str(tool_args["url"])
-            url = truncate_value(url, 80)
-            parts.append(url)
-        if parts:
-            return f"{tool_name}({' '.join(parts)})"
-
-    elif tool_name == "fetch_url":
-        # Fetch URL: show the URL being fetched
-        if "url" in tool_args:
-            url = str(tool_args["url"])
-            url = truncate_value(url, 80)
-            return f'{tool_name}("{url}")'
-
-    elif tool_name == "task":
-        # Task: show the task description
-        if "description" in tool_args:
-            desc = str(tool_args["description"])
-            desc = truncate_value(desc, 100)
-            return f'{tool_name}("{desc}")'
-
-    elif tool_name == "write_todos":
-        # Todos: show count of items
-        if "todos" in tool_args and isinstance(tool_args["todos"], list):
-            count = len(tool_args["todos"])
-            return f"{tool_name}({count} items)"
+    formatter = _TOOL_DISPLAY_FORMATTERS.get(tool_name)
+    if formatter is not None:
+        display = formatter(tool_name, tool_args)
+        if display is not None:
+            return display
 
     # Fallback: generic formatting for unknown tools
-    # Show all arguments in key=value format
-    args_str = ", ".join(f"{k}={truncate_value(str(v), 50)}" for k, v in tool_args.items())
+    # Show all arguments in key=value format. The length check is inlined because
+    # most values are short and never need truncating.
+    limit = _GENERIC_ARG_MAX_LENGTH
+    args_str = ", ".join(
+        f"{k}={s}" if len(s := str(v)) <= limit else f"{k}={s[:limit]}..."
+        for k, v in tool_args.items()
+    )
     return f"{tool_name}({args_str})"
 
 
+def _stringify_content_item(item: object) -> str:
+    """Convert a single ToolMessage content item into a string."""
+    if isinstance(item, str):
+        return item
+    try:
+        return json.dumps(item)
+    except Exception:
+        return str(item)
+
+
 def format_tool_message_content(content: Any) -> str:
     """Convert ToolMessage content into a printable string."""
+    if isinstance(content, str):
+        return content
     if content is None:
         return ""
     if isinstance(content, list):
-        parts = []
-        for item in content:
-            if isinstance(item, str):
-                parts.append(item)
-            else:
-                try:
-                    parts.append(json.dumps(item))
-                except Exception:
-                    parts.append(str(item))
-        return "\n".join(parts)
+        return "\n".join(_stringify_content_item(item) for item in content)
     return str(content)
 
 
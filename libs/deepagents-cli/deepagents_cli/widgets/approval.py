@@ -15,6 +15,12 @@ from textual.widgets import Static
 from deepagents_cli.widgets.tool_renderers import get_renderer
 
 
+class _ApprovalOption(Static):
+    """Selectable option row in the approval menu."""
+
+    DEFAULT_CLASSES = "approval-option"
+
+
 class ApprovalMenu(Container):
     """Approval menu using standard Textual patterns.
 
@@ -30,6 +36,8 @@ class ApprovalMenu(Container):
     can_focus = True
     can_focus_children = False
 
+    DEFAULT_CLASSES = "approval-menu"
+
     # CSS is in app.tcss - no DEFAULT_CSS needed
 
     BINDINGS: ClassVar[list[BindingType]] = [
@@ -60,7 +68,7 @@ class ApprovalMenu(Container):
         id: str | None = None,  # noqa: A002
         **kwargs: Any,
     ) -> None:
-        super().__init__(id=id or "approval-menu", classes="approval-menu", **kwargs)
+        super().__init__(id=id or "approval-menu", **kwargs)
         self._action_request = action_request
         self._assistant_id = assistant_id
         self._tool_name = action_request.get("name", "unknown")
@@ -91,7 +99,7 @@ class ApprovalMenu(Container):
         with Container(classes="approval-options-container"):
             # Options - create 3 Static widgets
             for i in range(3):
-                widget = Static("", classes="approval-option")
+                widget = _ApprovalOption("")
                 self._option_widgets.append(widget)
                 yield widget
 
@@ -109,20 +117,24 @@ class ApprovalMenu(Container):
             self._tool_info_container = Vertical(classes="tool-info-container")
             yield self._tool_info_container
 
-    async def on_mount(self) -> None:
-        """Focus self on mount and update tool info."""
-        await self._update_tool_info()
+    def on_mount(self) -> None:
+        """Show the options, take focus, and load tool info in the background."""
         self._update_options()
         self.focus()
+        # Tool info can take a while to render, so don't hold up the mount
+        # (and the quick keys) waiting for it
+        self.run_worker(self._update_tool_info(), exclusive=True)
 
     async def _update_tool_info(self) -> None:
         """Mount the tool-specific approval widget."""
         if not self._tool_info_container:
             return
 
-        # Get the appropriate renderer for this tool
+        # Get the appropriate renderer for this tool. Rendering can be slow
+        # (edit_file diffs the old and new strings), so run it in a thread to
+        # keep the UI responsive.
         renderer = get_renderer(self._tool_name)
-        widget_class, data = renderer.get_approval_widget(self._tool_args)
+        widget_class, data = await asyncio.to_thread(renderer.get_approval_widget, self._tool_args)
 
         # Clear existing content and mount new widget
         await self._tool_info_container.remove_children()
@@ -6,13 +6,23 @@ for slash commands (/) and file mentions (@).
 
 from __future__ import annotations
 
+import asyncio
+import heapq
+import os
 import subprocess
+import time
+from bisect import bisect_right
+from collections import deque
 from difflib import SequenceMatcher
 from enum import StrEnum
+from itertools import islice
+from operator import itemgetter
 from pathlib import Path
 from typing import TYPE_CHECKING, Protocol
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from textual import events
 
 
@@ -112,7 +122,8 @@ class SlashCommandController:
 
     def can_handle(self, text: str, cursor_index: int) -> bool:  # noqa: ARG002
         """Handle input that starts with /."""
-        return text.startswith("/")
+        # Slicing avoids a method lookup on this per-keystroke check
+        return text[:1] == "/"
 
     def reset(self) -> None:
         """Clear suggestions."""
@@ -203,8 +214,11 @@ class SlashCommandController:
 
 # Constants for fuzzy file completion
 _MAX_FALLBACK_FILES = 1000
+_MAX_FALLBACK_DEPTH = 3  # Directory levels below the root to walk without git
 _MIN_FUZZY_RATIO = 0.4
 _MIN_FUZZY_SCORE = 15  # Minimum score to include in results
+_FILENAME_FUZZY_WEIGHT = 30  # Score multiplier for fuzzy filename similarity
+_STALE_CHECK_INTERVAL = 1.0  # Seconds between checks for a stale file cache
 
 
 def _find_project_root(start_path: Path) -> Path:
@@ -219,75 +233,116 @@ def _find_project_root(start_path: Path) -> Path:
 def _get_project_files(root: Path) -> list[str]:
     """Get project files using git ls-files or fallback to glob."""
     try:
+        # -z gives NUL-terminated, unquoted paths; the output is decoded once
+        # with the filesystem encoding and split in a single pass
         result = subprocess.run(
-            ["git", "ls-files"],  # noqa: S607
+            ["git", "ls-files", "-z"],  # noqa: S607
             cwd=root,
             capture_output=True,
-            text=True,
             timeout=5,
             check=False,
         )
         if result.returncode == 0:
-            files = result.stdout.strip().split("\n")
+            files = os.fsdecode(result.stdout).split("\0")
             return [f for f in files if f]  # Filter empty strings
     except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
         pass
 
-    # Fallback: simple glob (limited depth to avoid slowness)
-    files = []
-    try:
-        for pattern in ["*", "*/*", "*/*/*", "*/*/*/*"]:
-            for p in root.glob(pattern):
-                if p.is_file() and not any(part.startswith(".") for part in p.parts):
-                    files.append(str(p.relative_to(root)))
-                if len(files) >= _MAX_FALLBACK_FILES:
-                    break
-            if len(files) >= _MAX_FALLBACK_FILES:
-                break
-    except OSError:
-        pass
-    return files
+    # Fallback: breadth-first directory walk (limited depth to avoid slowness)
+    return _walk_project_files(root)
+
 
+def _project_files_stamp(root: Path) -> tuple[int, int]:
+    """Get modification times that change when the project's file list does.
 
-def _fuzzy_score(query: str, candidate: str) -> float:  # noqa: PLR0911
-    """Score a candidate against query. Higher = better match."""
-    query_lower = query.lower()
-    candidate_lower = candidate.lower()
+    The git index is rewritten by add/rm/checkout, and the root directory's
+    mtime changes when top-level entries are created or removed. Missing
+    paths count as 0.
+    """
+    mtimes = []
+    for path in (root / ".git" / "index", root):
+        try:
+            mtimes.append(path.stat().st_mtime_ns)
+        except OSError:
+            mtimes.append(0)
+    return mtimes[0], mtimes[1]
+
+
+def _walk_project_files(root: Path) -> list[str]:
+    """List non-hidden files breadth-first, up to `_MAX_FALLBACK_DEPTH` levels deep.
+
+    Uses os.scandir so file/directory checks come from the cached directory
+    entry rather than a separate stat per path.
+    """
+    files: list[str] = []
+    # (directory path, relative prefix, depth)
+    queue: deque[tuple[str, str, int]] = deque([(str(root), "", 0)])
+    while queue:
+        dir_path, prefix, depth = queue.popleft()
+        try:
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    if entry.name.startswith("."):
+                        continue
+                    if entry.is_file():
+                        files.append(prefix + entry.name)
+                        if len(files) >= _MAX_FALLBACK_FILES:
+                            return files
+                    elif depth < _MAX_FALLBACK_DEPTH and entry.is_dir(follow_symlinks=False):
+                        queue.append((entry.path, f"{prefix}{entry.name}/", depth + 1))
+        except OSError:
+            continue
+    return files
 
-    # Extract filename for matching (prioritize filename over full path)
-    filename = candidate.rsplit("/", 1)[-1].lower()
-    filename_start = candidate_lower.rfind("/") + 1
 
-    # Check filename first (higher priority)
-    if query_lower in filename:
-        idx = filename.find(query_lower)
+def _substring_rank(  # noqa: PLR0911
+    query_lower: str, candidate: str, candidate_lower: str, filename_start: int
+) -> int:
+    """Rank where the query occurs in a candidate's path, or return 0 if it doesn't.
+
+    Args:
+        query_lower: Lowercased search query
+        candidate: File path
+        candidate_lower: Lowercased file path
+        filename_start: Offset of the filename within the path
+    """
+    # Check filename first (higher priority). Searching from filename_start
+    # finds matches within the filename without slicing it out, and a single
+    # find() replaces an `in` test followed by a second search.
+    idx = candidate_lower.find(query_lower, filename_start)
+    if idx >= 0:
         # Bonus for being at start of filename
-        if idx == 0:
-            return 150 + (1 / len(candidate))
+        if idx == filename_start:
+            return 150
         # Bonus for word boundary in filename
-        if idx > 0 and filename[idx - 1] in "_-.":
-            return 120 + (1 / len(candidate))
-        return 100 + (1 / len(candidate))
+        if candidate_lower[idx - 1] in "_-.":
+            return 120
+        return 100
 
     # Check full path
-    if query_lower in candidate_lower:
-        idx = candidate_lower.find(query_lower)
+    idx = candidate_lower.find(query_lower)
+    if idx >= 0:
         # At start of filename
         if idx == filename_start:
-            return 80 + (1 / len(candidate))
+            return 80
         # At word boundary in path
         if idx == 0 or candidate[idx - 1] in "/_-.":
-            return 60 + (1 / len(candidate))
-        return 40 + (1 / len(candidate))
+            return 60
+        return 40
+
+    return 0
 
-    # Fuzzy match on filename only (more relevant)
-    filename_ratio = SequenceMatcher(None, query_lower, filename).ratio()
-    if filename_ratio > _MIN_FUZZY_RATIO:
-        return filename_ratio * 30
 
-    # Fallback: fuzzy on full path
-    ratio = SequenceMatcher(None, query_lower, candidate_lower).ratio()
-    return ratio * 15
+def _file_type_hint(path: str) -> str:
+    """Get the lowercased file extension for display, or "file" if there is none.
+
+    Follows `Path.suffix` (leading-dot names like .env have no extension)
+    without building a Path object for every suggestion.
+    """
+    dot = path.rfind(".")
+    if path.rfind("/") + 1 < dot < len(path) - 1:
+        return path[dot + 1 :].lower()
+    return "file"
 
 
 def _is_dotpath(path: str) -> bool:
@@ -300,28 +355,178 @@ def _path_depth(path: str) -> int:
     return path.count("/")
 
 
-def _fuzzy_search(
-    query: str, candidates: list[str], limit: int = 10, *, include_dotfiles: bool = False
-) -> list[str]:
-    """Return top matches sorted by score.
+_by_score = itemgetter(0)
+"""Sort key for (score, index) pairs."""
+
+
+def _score_filename_similarity(
+    query_lower: str, filenames: list[str], candidates: Iterable[int], limit: int
+) -> list[int]:
+    """Rank candidates by fuzzy filename similarity, best first.
+
+    Only matches that reach `_MIN_FUZZY_SCORE` are returned.
 
     Args:
-        query: Search query
-        candidates: List of file paths to search
+        query_lower: Lowercased search query
+        filenames: Lowercased filename of every indexed path
+        candidates: Indices of paths that do not contain the query as a substring
         limit: Max results to return
-        include_dotfiles: Whether to include dotfiles (default False)
     """
-    # Filter dotfiles unless explicitly searching for them
-    filtered = candidates if include_dotfiles else [c for c in candidates if not _is_dotpath(c)]
+    # Lowest ratio whose weighted score can still reach the minimum score
+    min_ratio = max(_MIN_FUZZY_RATIO, _MIN_FUZZY_SCORE / _FILENAME_FUZZY_WEIGHT)
+
+    # The query side is fixed, so a single matcher is reused. real_quick_ratio()
+    # and quick_ratio() are cheap upper bounds on ratio(), which lets most
+    # candidates be rejected without running the full matching algorithm.
+    # Large repositories repeat filenames heavily (__init__.py, index.ts, ...),
+    # so each distinct filename is only scored once.
+    matcher = SequenceMatcher(None, query_lower)
+    ratios: dict[str, float] = {}
+    scored: list[tuple[float, int]] = []
+    for i in candidates:
+        filename = filenames[i]
+        ratio = ratios.get(filename)
+        if ratio is None:
+            matcher.set_seq2(filename)
+            if matcher.real_quick_ratio() >= min_ratio and matcher.quick_ratio() >= min_ratio:
+                ratio = matcher.ratio()
+            else:
+                ratio = 0.0
+            ratios[filename] = ratio
+        if ratio >= min_ratio:
+            scored.append((ratio, i))
+    return [i for _, i in heapq.nlargest(limit, scored, key=_by_score)]
+
+
+class _FileIndex:
+    """Searchable index over a project's file list.
+
+    Built once per file cache load so each keystroke only looks at paths that
+    actually contain the query, instead of rescanning the whole list.
+    """
 
-    if not query:
-        # Empty query: show root-level files first, sorted by depth then name
-        sorted_files = sorted(filtered, key=lambda p: (_path_depth(p), p.lower()))
-        return sorted_files[:limit]
+    def __init__(self, files: list[str], stamp: tuple[int, int] = (0, 0)) -> None:
+        """Build the index.
 
-    scored = [(score, c) for c in filtered if (score := _fuzzy_score(query, c)) >= _MIN_FUZZY_SCORE]
-    scored.sort(key=lambda x: -x[0])
-    return [c for _, c in scored[:limit]]
+        Args:
+            files: File paths relative to the project root
+            stamp: `_project_files_stamp` taken before the files were listed
+        """
+        self.files = files
+        self.stamp = stamp
+        # Per-path data is precomputed in parallel lists indexed like `files`,
+        # so scoring never re-lowercases, re-splits or re-checks a path
+        self._lowered = [f.lower() for f in files]
+        self._filename_starts = [path.rfind("/") + 1 for path in self._lowered]
+        self._filenames = [
+            path[start:] for path, start in zip(self._lowered, self._filename_starts, strict=True)
+        ]
+        self._is_dot = [_is_dotpath(f) for f in files]
+        self._non_dot = [i for i, is_dot in enumerate(self._is_dot) if not is_dot]
+        # Empty-query order (root-level files first, then by name), sorted once
+        # here so showing the initial suggestions doesn't re-sort every path
+        lowered = self._lowered
+        self._by_depth = sorted(
+            range(len(files)), key=lambda i: (_path_depth(files[i]), lowered[i])
+        )
+        # Lowercased paths joined with NUL (which cannot appear in a path), so
+        # substring lookups are str.find scans in C instead of a Python loop
+        self._corpus = "\0".join(self._lowered)
+        self._starts: list[int] = []
+        offset = 0
+        for path in self._lowered:
+            self._starts.append(offset)
+            offset += len(path) + 1
+        # Matches for the previous query, reused while the user keeps typing
+        self._last_query = ""
+        self._last_matches: list[int] = []
+
+    def _substring_matches(self, query_lower: str) -> list[int]:
+        """Return indices of paths containing `query_lower`, in file order."""
+        if self._last_query and query_lower.startswith(self._last_query):
+            # Every path containing the longer query also contains the previous
+            # one, so only the previous matches need rechecking
+            lowered = self._lowered
+            matches = [i for i in self._last_matches if query_lower in lowered[i]]
+        else:
+            matches = self._scan_corpus(query_lower)
+        self._last_query = query_lower
+        self._last_matches = matches
+        return matches
+
+    def _scan_corpus(self, query_lower: str) -> list[int]:
+        """Find every path containing `query_lower` by scanning the joined corpus."""
+        matches: list[int] = []
+        find = self._corpus.find
+        starts = self._starts
+        last = len(starts) - 1
+        pos = find(query_lower)
+        while pos >= 0:
+            idx = bisect_right(starts, pos) - 1
+            matches.append(idx)
+            if idx == last:
+                break
+            # One hit per path is enough; resume at the next path
+            pos = find(query_lower, starts[idx + 1])
+        return matches
+
+    def search(self, query: str, limit: int = 10, *, include_dotfiles: bool = False) -> list[str]:
+        """Return top matches sorted by score.
+
+        Args:
+            query: Search query
+            limit: Max results to return
+            include_dotfiles: Whether to include dotfiles (default False)
+        """
+        files = self.files
+
+        if not query:
+            # Empty query: show root-level files first, sorted by depth then name
+            order: Iterable[int] = self._by_depth
+            if not include_dotfiles:
+                is_dot = self._is_dot
+                order = (i for i in order if not is_dot[i])
+            return [files[i] for i in islice(order, limit)]
+
+        # Substring matches always outrank fuzzy ones (40+ vs at most
+        # _FILENAME_FUZZY_WEIGHT), and a non-substring path can never reach
+        # _MIN_FUZZY_SCORE through full-path similarity. Score substring matches
+        # directly and only run similarity scoring to fill any remaining slots.
+        query_lower = query.lower()
+        matched = self._substring_matches(query_lower)
+        if not include_dotfiles:
+            is_dot = self._is_dot
+            matched = [i for i in matched if not is_dot[i]]
+        lowered = self._lowered
+        filename_starts = self._filename_starts
+        # Each match gets a single int key: rank first, then shorter paths.
+        # Ranks are 20+ apart, so the length in the low bits never changes the
+        # rank order, and no float or (score, path) tuple is allocated per match.
+        keys: dict[int, int] = {}
+        for i in matched:
+            path = files[i]
+            rank = _substring_rank(query_lower, path, lowered[i], filename_starts[i])
+            if rank:
+                keys[i] = (rank << 32) - len(path)
+        # Only the top `limit` entries are kept, so a bounded heap selection
+        # replaces sorting every match. nlargest keeps ties in input order,
+        # matching a stable sort.
+        results = [files[i] for i in heapq.nlargest(limit, keys, key=keys.__getitem__)]
+
+        # Single-character queries are fully covered by the substring pass
+        if len(results) < limit and len(query_lower) > 1:
+            # Candidates are streamed as indices into the precomputed filenames,
+            # so no per-keystroke lists of paths or filename slices are built
+            matched_set = set(matched)
+            pool = range(len(files)) if include_dotfiles else self._non_dot
+            fuzzy = _score_filename_similarity(
+                query_lower,
+                self._filenames,
+                (i for i in pool if i not in matched_set),
+                limit - len(results),
+            )
+            results.extend(files[i] for i in fuzzy)
+        return results
 
 
 class FuzzyFileController:
@@ -343,37 +548,96 @@ class FuzzyFileController:
         self._project_root = _find_project_root(self._cwd)
         self._suggestions: list[tuple[str, str]] = []
         self._selected_index = 0
-        self._file_cache: list[str] | None = None
+        self._file_cache: _FileIndex | None = None
+        self._loading: asyncio.Future[_FileIndex] | None = None
+        # Input seen while files were loading, replayed once they arrive
+        self._pending_input: tuple[str, int] | None = None
+        self._last_stale_check = 0.0
+        self._start_background_load()
+
+    def _load_index(self) -> _FileIndex:
+        """List project files and build the search index."""
+        # Stamp first, so changes made while listing still mark the index stale
+        stamp = _project_files_stamp(self._project_root)
+        return _FileIndex(_get_project_files(self._project_root), stamp)
+
+    def _start_background_load(self) -> None:
+        """Load the file index in a worker thread so git doesn't block the UI.
+
+        Without a running event loop (e.g. in tests) the index is loaded
+        synchronously on first use instead.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._loading = loop.run_in_executor(None, self._load_index)
+        self._loading.add_done_callback(self._on_index_loaded)
 
-    def _get_files(self) -> list[str]:
-        """Get cached file list or refresh."""
+    def _on_index_loaded(self, future: asyncio.Future[_FileIndex]) -> None:
+        """Store the loaded index and refresh suggestions typed while loading."""
+        if future is not self._loading:
+            # Superseded by refresh_cache
+            return
+        self._loading = None
+        if future.exception() is not None:
+            # Leave the cache empty so the next lookup loads synchronously
+            return
+        self._file_cache = future.result()
+        pending, self._pending_input = self._pending_input, None
+        if pending is not None:
+            self.on_text_changed(*pending)
+
+    def _get_files(self) -> _FileIndex | None:
+        """Get cached file index, or None while it is loading in the background."""
         if self._file_cache is None:
-            self._file_cache = _get_project_files(self._project_root)
+            if self._loading is not None:
+                return None
+            self._file_cache = self._load_index()
+        elif self._loading is None and self._is_cache_stale():
+            # Keep serving the current index while the new one loads
+            self._start_background_load()
+            if self._loading is None:
+                self._file_cache = self._load_index()
         return self._file_cache
 
+    def _is_cache_stale(self) -> bool:
+        """Check whether files changed since the cache was loaded.
+
+        Only a couple of stat calls, and at most once per
+        `_STALE_CHECK_INTERVAL`, so it is cheap enough to run on every key.
+        """
+        now = time.monotonic()
+        if now - self._last_stale_check < _STALE_CHECK_INTERVAL:
+            return False
+        self._last_stale_check = now
+        cache = self._file_cache
+        return cache is not None and _project_files_stamp(self._project_root) != cache.stamp
+
     def refresh_cache(self) -> None:
         """Force refresh of file cache."""
         self._file_cache = None
+        if self._loading is not None:
+            self._loading.cancel()
+            self._loading = None
+        self._start_background_load()
 
     def can_handle(self, text: str, cursor_index: int) -> bool:
         """Handle input that contains @ not followed by space."""
         if cursor_index <= 0 or cursor_index > len(text):
             return False
 
-        before_cursor = text[:cursor_index]
-        if "@" not in before_cursor:
-            return False
-
-        at_index = before_cursor.rfind("@")
-        if cursor_index <= at_index:
+        # Bounded searches avoid copying the text before the cursor on every key
+        at_index = text.rfind("@", 0, cursor_index)
+        if at_index < 0:
             return False
 
         # Fragment from @ to cursor must not contain spaces
-        fragment = before_cursor[at_index:cursor_index]
-        return bool(fragment) and " " not in fragment
+        return text.find(" ", at_index, cursor_index) < 0
 
     def reset(self) -> None:
         """Clear suggestions."""
+        self._pending_input = None
         if self._suggestions:
             self._suggestions.clear()
             self._selected_index = 0
@@ -385,9 +649,8 @@ class FuzzyFileController:
             self.reset()
             return
 
-        before_cursor = text[:cursor_index]
-        at_index = before_cursor.rfind("@")
-        search = before_cursor[at_index + 1 :]
+        at_index = text.rfind("@", 0, cursor_index)
+        search = text[at_index + 1 : cursor_index]
 
         suggestions = self._get_fuzzy_suggestions(search)
 
@@ -397,22 +660,19 @@ class FuzzyFileController:
             self._view.render_completion_suggestions(self._suggestions, self._selected_index)
         else:
             self.reset()
+            if self._loading is not None:
+                self._pending_input = (text, cursor_index)
 
     def _get_fuzzy_suggestions(self, search: str) -> list[tuple[str, str]]:
         """Get fuzzy file suggestions."""
-        files = self._get_files()
+        index = self._get_files()
+        if index is None:
+            return []
         # Include dotfiles only if query starts with "."
         include_dots = search.startswith(".")
-        matches = _fuzzy_search(search, files, limit=MAX_SUGGESTIONS, include_dotfiles=include_dots)
-
-        suggestions: list[tuple[str, str]] = []
-        for path in matches:
-            # Get file extension for type hint
-            ext = Path(path).suffix.lower()
-            type_hint = ext[1:] if ext else "file"
-            suggestions.append((f"@{path}", type_hint))
+        matches = index.search(search, limit=MAX_SUGGESTIONS, include_dotfiles=include_dots)
 
-        return suggestions
+        return [(f"@{path}", _file_type_hint(path)) for path in matches]
 
     def on_key(  # noqa: PLR0911
         self, event: events.Key, text: str, cursor_index: int
@@ -452,8 +712,7 @@ class FuzzyFileController:
             return False
 
         label, _ = self._suggestions[self._selected_index]
-        before_cursor = text[:cursor_index]
-        at_index = before_cursor.rfind("@")
+        at_index = text.rfind("@", 0, cursor_index)
 
         if at_index < 0:
             return False
@@ -5,7 +5,7 @@ from __future__ import annotations
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, ClassVar
 
-from rich.text import Text
+from rich.text import Span, Text
 from textual import events  # noqa: TC002 - used at runtime in _on_key
 from textual.binding import Binding
 from textual.containers import Horizontal, Vertical
@@ -24,6 +24,14 @@ from deepagents_cli.widgets.history import HistoryManager
 
 if TYPE_CHECKING:
     from textual.app import ComposeResult
+    from textual.timer import Timer
+
+
+def _row_styles(*, selected: bool) -> tuple[str, str]:
+    """Return the (label, description) styles for a completion row."""
+    if selected:
+        return "bold reverse", "italic"
+    return "bold", "dim"
 
 
 class CompletionPopup(Static):
@@ -39,6 +47,12 @@ class CompletionPopup(Static):
         """Initialize the completion popup."""
         super().__init__("", **kwargs)
         self.can_focus = False
+        # Last rendered suggestions, kept so moving the selection only restyles
+        # the two affected rows instead of rebuilding the whole Text
+        self._suggestions: list[tuple[str, str]] = []
+        self._selected_index = -1
+        self._text: Text | None = None
+        self._row_spans: list[range] = []
 
     def update_suggestions(self, suggestions: list[tuple[str, str]], selected_index: int) -> None:
         """Update the popup with new suggestions."""
@@ -46,28 +60,52 @@ class CompletionPopup(Static):
             self.hide()
             return
 
+        if self._text is not None and suggestions == self._suggestions:
+            if selected_index != self._selected_index:
+                self._restyle_row(self._selected_index, selected=False)
+                self._restyle_row(selected_index, selected=True)
+                self._selected_index = selected_index
+        else:
+            self._build_text(suggestions, selected_index)
+
+        self.update(self._text)
+        self.show()
+
+    def _build_text(self, suggestions: list[tuple[str, str]], selected_index: int) -> None:
+        """Render all suggestions, recording which spans belong to each row."""
         text = Text()
+        row_spans: list[range] = []
         for idx, (label, description) in enumerate(suggestions):
             if idx:
                 text.append("\n")
 
-            if idx == selected_index:
-                label_style = "bold reverse"
-                desc_style = "italic"
-            else:
-                label_style = "bold"
-                desc_style = "dim"
-
+            label_style, desc_style = _row_styles(selected=idx == selected_index)
+            first_span = len(text.spans)
             text.append(label, style=label_style)
             if description:
                 text.append("  ")
                 text.append(description, style=desc_style)
+            row_spans.append(range(first_span, len(text.spans)))
 
-        self.update(text)
-        self.show()
+        self._suggestions = list(suggestions)
+        self._selected_index = selected_index
+        self._text = text
+        self._row_spans = row_spans
+
+    def _restyle_row(self, idx: int, *, selected: bool) -> None:
+        """Swap the styles of one row's label and description spans in place."""
+        if self._text is None or not 0 <= idx < len(self._row_spans):
+            return
+        spans = self._text.spans
+        styles = _row_styles(selected=selected)
+        for span_idx, style in zip(self._row_spans[idx], styles, strict=False):
+            span = spans[span_idx]
+            spans[span_idx] = Span(span.start, span.end, style)
 
     def hide(self) -> None:
         """Hide the popup."""
+        self._suggestions = []
+        self._text = None
         self.update("")
         self.styles.display = "none"
 
@@ -306,11 +344,16 @@ class ChatInput(Vertical):
         self._text_area: ChatTextArea | None = None
         self._popup: CompletionPopup | None = None
         self._completion_manager: MultiCompletionManager | None = None
+        # Start offset of each line in the text they were computed for
+        self._line_starts: list[int] | None = None
+        self._line_starts_text = ""
 
         # Set up history manager
         if history_file is None:
             history_file = Path.home() / ".deepagents" / "history.jsonl"
         self._history = HistoryManager(history_file)
+        # Writes history entries the manager is still buffering
+        self._history_flush_timer: Timer | None = None
 
     def compose(self) -> ComposeResult:
         """Compose the chat input layout."""
@@ -334,9 +377,30 @@ class ChatInput(Vertical):
 
         self._text_area.focus()
 
+    def on_unmount(self) -> None:
+        """Write buffered history entries and close the history file."""
+        if self._history_flush_timer is not None:
+            self._history_flush_timer.stop()
+            self._history_flush_timer = None
+        self._history.close()
+
+    def _add_to_history(self, value: str) -> None:
+        """Add an entry to history and make sure it reaches the file soon."""
+        self._history.add(value)
+        if self._history.has_pending and self._history_flush_timer is None:
+            self._history_flush_timer = self.set_timer(
+                self._history.flush_interval, self._flush_history
+            )
+
+    def _flush_history(self) -> None:
+        """Write buffered history entries (timer callback)."""
+        self._history_flush_timer = None
+        self._history.flush()
+
     def on_text_area_changed(self, event: TextArea.Changed) -> None:
         """Detect input mode and update completions."""
         text = event.text_area.text
+        self._line_starts = None
 
         # Update mode based on first character
         if text.startswith("!"):
@@ -364,7 +428,7 @@ class ChatInput(Vertical):
             if self._completion_manager:
                 self._completion_manager.reset()
 
-            self._history.add(value)
+            self._add_to_history(value)
             self.post_message(self.Submitted(value, self.mode))
             if self._text_area:
                 self._text_area.clear_text()
@@ -405,7 +469,7 @@ class ChatInput(Vertical):
                 value = self._text_area.text.strip()
                 if value:
                     self._completion_manager.reset()
-                    self._history.add(value)
+                    self._add_to_history(value)
                     self.post_message(self.Submitted(value, self.mode))
                     self._text_area.clear_text()
                     self.mode = "normal"
@@ -415,7 +479,7 @@ class ChatInput(Vertical):
                 if value:
                     event.prevent_default()
                     event.stop()
-                    self._history.add(value)
+                    self._add_to_history(value)
                     self.post_message(self.Submitted(value, self.mode))
                     self._text_area.clear_text()
                     self.mode = "normal"
@@ -431,12 +495,25 @@ class ChatInput(Vertical):
         if not text:
             return 0
 
-        lines = text.split("\n")
-        row = max(0, min(row, len(lines) - 1))
+        line_starts = self._get_line_starts(text)
+        row = max(0, min(row, len(line_starts) - 1))
         col = max(0, col)
 
-        offset = sum(len(lines[i]) + 1 for i in range(row))
-        return offset + min(col, len(lines[row]))
+        # Length of the row without its trailing newline
+        line_end = line_starts[row + 1] - 1 if row + 1 < len(line_starts) else len(text)
+        return line_starts[row] + min(col, line_end - line_starts[row])
+
+    def _get_line_starts(self, text: str) -> list[int]:
+        """Return the start offset of each line, rebuilt only when the text changes."""
+        if self._line_starts is None or text != self._line_starts_text:
+            line_starts = [0]
+            pos = text.find("\n")
+            while pos != -1:
+                line_starts.append(pos + 1)
+                pos = text.find("\n", pos + 1)
+            self._line_starts = line_starts
+            self._line_starts_text = text
+        return self._line_starts
 
     def watch_mode(self, mode: str) -> None:
         """Post mode changed message when mode changes."""
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+from functools import cached_property
 from typing import TYPE_CHECKING, Any
 
 from textual.containers import Vertical
@@ -11,6 +12,22 @@ from textual.widgets import Static
 if TYPE_CHECKING:
     from textual.app import ComposeResult
 
+_HUNK_RE = re.compile(r"@@ -(\d+)(?:,\d+)? \+(\d+)")
+"""Unified diff hunk header, capturing the old and new starting line numbers."""
+
+# Markup around each formatted line, split at the line number and content.
+# Deletions and additions get a colored gutter bar and background, context
+# lines a dim gutter.
+_DEL_PREFIX = "[red bold]▌[/red bold][dim]"
+_DEL_MID = "[/dim] [on #2d1515]"
+_DEL_SUFFIX = "[/on #2d1515]"
+_ADD_PREFIX = "[green bold]▌[/green bold][dim]"
+_ADD_MID = "[/dim] [on #152d15]"
+_ADD_SUFFIX = "[/on #152d15]"
+_CTX_PREFIX = "[dim]│"
+_CTX_MID = "[/dim]  "
+_ELLIPSIS_ROW = "[dim]...[/dim]"
+
 
 def _escape_markup(text: str) -> str:
     """Escape Rich markup characters in text.
@@ -21,7 +38,12 @@ def _escape_markup(text: str) -> str:
     Returns:
         Escaped text safe for Rich rendering
     """
-    # Escape brackets that could be interpreted as markup
+    # Most lines have no brackets at all, so skip building a new string
+    if "[" not in text and "]" not in text:
+        return text
+    # Escape brackets that could be interpreted as markup. str.translate is
+    # much slower here, since mapping to multi-character strings takes its
+    # slow path.
     return text.replace("[", r"\[").replace("]", r"\]")
 
 
@@ -35,83 +57,128 @@ def format_diff_textual(diff: str, max_lines: int | None = 100) -> str:
     Returns:
         Rich-formatted diff string with line numbers
     """
+    return _format_diff(diff, max_lines)[0]
+
+
+def _format_diff(diff: str, max_lines: int | None) -> tuple[str, int, int]:
+    """Format a unified diff and count its changes in a single pass.
+
+    Args:
+        diff: Unified diff string
+        max_lines: Maximum number of diff lines to show (None for unlimited)
+
+    Returns:
+        Tuple of (Rich-formatted diff, additions, deletions)
+    """
     if not diff:
-        return "[dim]No changes detected[/dim]"
+        return "[dim]No changes detected[/dim]", 0, 0
 
     lines = diff.splitlines()
 
-    # Compute stats first
-    additions = sum(1 for ln in lines if ln.startswith("+") and not ln.startswith("+++"))
-    deletions = sum(1 for ln in lines if ln.startswith("-") and not ln.startswith("---"))
-
-    # Find max line number for width calculation
+    # One pass classifies every line, counting stats and finding the max line
+    # number for the gutter width. Shown lines are collected as
+    # (marker, line number, content) and only formatted once the width is known.
+    additions = deletions = 0
     max_line = 0
+    old_num = new_num = 0
+    rows: list[tuple[str, int, str]] = []
+    truncated = False
+
     for line in lines:
-        if m := re.match(r"@@ -(\d+)(?:,\d+)? \+(\d+)", line):
-            max_line = max(max_line, int(m.group(1)), int(m.group(2)))
+        if not truncated and max_lines and len(rows) >= max_lines:
+            truncated = True
+
+        # Dispatch on the first character; the three-character file header
+        # checks only run for lines that already start with + or -
+        first = line[:1]
+        if first == "+":
+            # Skip file headers
+            if line[:3] == "+++":
+                continue
+            additions += 1
+            if not truncated:
+                rows.append(("+", new_num, line[1:]))
+                new_num += 1
+        elif first == "-":
+            if line[:3] == "---":
+                continue
+            deletions += 1
+            if not truncated:
+                rows.append(("-", old_num, line[1:]))
+                old_num += 1
+        elif first == " ":
+            if not truncated:
+                rows.append((" ", old_num, line[1:]))
+                old_num += 1
+                new_num += 1
+        elif first == "@" and (m := _HUNK_RE.match(line)):
+            # Hunk headers only update line numbers, they aren't displayed.
+            # They are the only lines the regex can match, so it never runs on
+            # diff content, and the width needs no separate pass over them.
+            hunk_old, hunk_new = int(m.group(1)), int(m.group(2))
+            max_line = max(max_line, hunk_old, hunk_new)
+            old_num, new_num = hunk_old, hunk_new
+        elif not truncated and line.strip() == "...":
+            rows.append(("...", 0, ""))
+
     width = max(3, len(str(max_line + len(lines))))
 
     formatted = []
 
     # Add stats header
+    stats = _format_stats(additions, deletions)
+    if stats:
+        formatted.append(stats)
+        formatted.append("")  # Blank line after stats
+
+    formatted.extend(_format_rows(rows, width))
+
+    if truncated:
+        formatted.append(f"\n[dim]... ({len(lines) - len(rows)} more lines)[/dim]")
+
+    return "\n".join(formatted), additions, deletions
+
+
+def _format_stats(additions: int, deletions: int) -> str:
+    """Format the +additions -deletions summary, or "" if nothing changed."""
     stats_parts = []
     if additions:
         stats_parts.append(f"[green]+{additions}[/green]")
     if deletions:
         stats_parts.append(f"[red]-{deletions}[/red]")
-    if stats_parts:
-        formatted.append(" ".join(stats_parts))
-        formatted.append("")  # Blank line after stats
-
-    old_num = new_num = 0
-    line_count = 0
+    return " ".join(stats_parts)
 
-    for line in lines:
-        if max_lines and line_count >= max_lines:
-            formatted.append(f"\n[dim]... ({len(lines) - line_count} more lines)[/dim]")
-            break
-
-        # Skip file headers (--- and +++)
-        if line.startswith(("---", "+++")):
-            continue
 
-        # Handle hunk headers - just update line numbers, don't display
-        if m := re.match(r"@@ -(\d+)(?:,\d+)? \+(\d+)", line):
-            old_num, new_num = int(m.group(1)), int(m.group(2))
-            continue
-
-        # Handle diff lines - use gutter bar instead of +/- prefix
-        content = line[1:] if line else ""
+def _format_rows(rows: list[tuple[str, int, str]], width: int) -> list[str]:
+    """Format classified diff lines with a gutter bar instead of a +/- prefix."""
+    # Line numbers are padded with str.rjust, which skips parsing a format
+    # spec for every line
+    formatted = []
+    for marker, num, content in rows:
         escaped_content = _escape_markup(content)
-
-        if line.startswith("-"):
+        if marker == "-":
             # Deletion - red gutter bar, subtle red background
             formatted.append(
-                f"[red bold]▌[/red bold][dim]{old_num:>{width}}[/dim] "
-                f"[on #2d1515]{escaped_content}[/on #2d1515]"
+                "".join(
+                    (_DEL_PREFIX, str(num).rjust(width), _DEL_MID, escaped_content, _DEL_SUFFIX)
+                )
             )
-            old_num += 1
-            line_count += 1
-        elif line.startswith("+"):
+        elif marker == "+":
             # Addition - green gutter bar, subtle green background
             formatted.append(
-                f"[green bold]▌[/green bold][dim]{new_num:>{width}}[/dim] "
-                f"[on #152d15]{escaped_content}[/on #152d15]"
+                "".join(
+                    (_ADD_PREFIX, str(num).rjust(width), _ADD_MID, escaped_content, _ADD_SUFFIX)
+                )
             )
-            new_num += 1
-            line_count += 1
-        elif line.startswith(" "):
+        elif marker == " ":
             # Context line - dim gutter
-            formatted.append(f"[dim]│{old_num:>{width}}[/dim]  {escaped_content}")
-            old_num += 1
-            new_num += 1
-            line_count += 1
-        elif line.strip() == "...":
+            formatted.append(
+                "".join((_CTX_PREFIX, str(num).rjust(width), _CTX_MID, escaped_content))
+            )
+        else:
             # Truncation marker
-            formatted.append("[dim]...[/dim]")
-            line_count += 1
-
-    return "\n".join(formatted)
+            formatted.append(_ELLIPSIS_ROW)
+    return formatted
 
 
 class EnhancedDiff(Vertical):
@@ -160,35 +227,26 @@ class EnhancedDiff(Vertical):
         self._diff = diff
         self._title = title
         self._max_lines = max_lines
-        self._stats = self._compute_stats()
 
-    def _compute_stats(self) -> tuple[int, int]:
-        """Compute additions and deletions count.
+    @cached_property
+    def _rendered(self) -> tuple[str, int, int]:
+        """Formatted diff with its addition and deletion counts.
 
-        Returns:
-            Tuple of (additions, deletions)
+        Computed once per widget, so recomposing or remounting doesn't rescan
+        the diff. To show a different diff, replace the widget rather than
+        changing ``_diff``.
         """
-        additions = 0
-        deletions = 0
-        for line in self._diff.splitlines():
-            if line.startswith("+") and not line.startswith("+++"):
-                additions += 1
-            elif line.startswith("-") and not line.startswith("---"):
-                deletions += 1
-        return additions, deletions
+        # The formatter counts additions/deletions while formatting, so the
+        # diff is only scanned once
+        return _format_diff(self._diff, self._max_lines)
 
     def compose(self) -> ComposeResult:
         """Compose the diff widget layout."""
         yield Static(f"[bold cyan]═══ {self._title} ═══[/bold cyan]", classes="diff-title")
 
-        formatted = format_diff_textual(self._diff, self._max_lines)
+        formatted, additions, deletions = self._rendered
         yield Static(formatted, classes="diff-content")
 
-        additions, deletions = self._stats
-        if additions or deletions:
-            stats_parts = []
-            if additions:
-                stats_parts.append(f"[green]+{additions}[/green]")
-            if deletions:
-                stats_parts.append(f"[red]-{deletions}[/red]")
-            yield Static(" ".join(stats_parts), classes="diff-stats")
+        stats = _format_stats(additions, deletions)
+        if stats:
+            yield Static(stats, classes="diff-stats")
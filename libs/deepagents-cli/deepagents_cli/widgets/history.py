@@ -2,15 +2,64 @@
 
 from __future__ import annotations
 
+import atexit
+import contextlib
 import json
-from pathlib import Path  # noqa: TC003 - used at runtime in type hints
+import os
+import tempfile
+import time
+import weakref
+from bisect import bisect_left, bisect_right
+from collections import deque
+from pathlib import Path
+from typing import TYPE_CHECKING, TextIO
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+_TAIL_BYTES_PER_ENTRY = 1024
+"""Estimated bytes per entry when sizing the tail of the file to read on load."""
+
+_FLUSH_BATCH_SIZE = 8
+"""Buffered entries that trigger a write to the history file."""
+
+
+def _serialize_entry(text: str) -> str:
+    """Serialize an entry as a JSON string line.
+
+    Printable ASCII without quotes or backslashes needs no escaping, which
+    covers most commands, so json.dumps only runs for the rest.
+    """
+    if text.isascii() and text.isprintable() and '"' not in text and "\\" not in text:
+        return f'"{text}"\n'
+    return json.dumps(text) + "\n"
+
+
+_live_managers: weakref.WeakSet[HistoryManager] = weakref.WeakSet()
+"""Managers that may still hold buffered entries, closed at interpreter exit."""
+
+
+@atexit.register
+def _close_live_managers() -> None:
+    """Write buffered entries and close the file of every manager still alive."""
+    for manager in list(_live_managers):
+        manager.close()
 
 
 class HistoryManager:
     """Manages command history with file persistence.
 
     Uses append-only writes for concurrent safety. Multiple agents can
-    safely write to the same history file without corruption.
+    safely write to the same history file without corruption. Entries added
+    in quick succession are buffered until `flush()` (or a full batch), so
+    callers should flush within `flush_interval` while `has_pending` is set;
+    anything still buffered is written at interpreter exit.
+    """
+
+    flush_interval: float = 1.0
+    """Seconds after the last write before a new entry is written immediately.
+
+    Entries added sooner are buffered; callers should flush them within this delay.
     """
 
     def __init__(self, history_file: Path, max_entries: int = 100) -> None:
@@ -23,52 +72,156 @@ class HistoryManager:
         self.history_file = history_file
         self.max_entries = max_entries
         self._entries: list[str] = []
+        # Entry indices grouped by first character, for prefix navigation
+        self._prefix_index: dict[str, list[int]] = {}
         self._current_index: int = -1
         self._temp_input: str = ""
+        # Serialized lines not yet written to the history file
+        self._pending: list[str] = []
+        self._last_flush = 0.0
+        # Append handle kept open between writes (O_APPEND keeps it concurrent-safe)
+        self._file: TextIO | None = None
         self._load_history()
+        _live_managers.add(self)
 
     def _load_history(self) -> None:
-        """Load history from file."""
+        """Load the most recent entries from file.
+
+        Only the tail of the file is read, so startup time doesn't grow with
+        the file (it is only compacted once it reaches 2x max_entries).
+        """
         if not self.history_file.exists():
             return
 
         try:
-            with self.history_file.open("r", encoding="utf-8") as f:
-                entries = []
-                for raw_line in f:
-                    line = raw_line.rstrip("\n\r")
-                    if not line:
-                        continue
-                    try:
-                        entry = json.loads(line)
-                    except json.JSONDecodeError:
-                        entry = line
-                    entries.append(entry if isinstance(entry, str) else str(entry))
-                self._entries = entries[-self.max_entries :]
+            with self.history_file.open("rb") as f:
+                size = f.seek(0, os.SEEK_END)
+                window = self.max_entries * _TAIL_BYTES_PER_ENTRY
+                while True:
+                    start = max(0, size - window)
+                    f.seek(start)
+                    data = f.read()
+                    if start:
+                        # Drop the partial line the window starts in
+                        newline = data.find(b"\n")
+                        data = data[newline + 1 :] if newline >= 0 else b""
+                    entries = self._parse_entries(data.decode("utf-8"))
+                    if not start or len(entries) >= self.max_entries:
+                        break
+                    # Entries are longer than estimated, widen the window
+                    window *= 4
+            self._entries = list(entries)
         except (OSError, UnicodeDecodeError):
             self._entries = []
+        self._rebuild_prefix_index()
+
+    def _parse_entries(self, text: str) -> deque[str]:
+        """Parse JSON-lines history text, keeping the last max_entries entries."""
+        # Lines are split the way text-mode file iteration does (universal newlines)
+        lines = text.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+        # A bounded deque drops older entries as newer ones are appended
+        entries: deque[str] = deque(maxlen=self.max_entries)
+        for line in lines:
+            if not line:
+                continue
+            # Strings with nothing to unescape are just the text between quotes
+            body = line[1:-1]
+            if (
+                len(line) > 1
+                and line[0] == '"'
+                and line[-1] == '"'
+                and "\\" not in body
+                and '"' not in body
+                and body.isprintable()
+            ):
+                entries.append(body)
+                continue
+            # Anything else is decoded as JSON, falling back to the raw line
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                entry = line
+            entries.append(entry if isinstance(entry, str) else str(entry))
+        return entries
 
     def _append_to_file(self, text: str) -> None:
-        """Append a single entry to history file (concurrent-safe)."""
+        """Queue an entry for the history file, writing the batch when due."""
+        self._pending.append(_serialize_entry(text))
+        if (
+            len(self._pending) >= _FLUSH_BATCH_SIZE
+            or time.monotonic() - self._last_flush > self.flush_interval
+        ):
+            self.flush()
+
+    @property
+    def has_pending(self) -> bool:
+        """Whether entries are buffered and waiting for `flush()`."""
+        return bool(self._pending)
+
+    def flush(self) -> None:
+        """Append buffered entries to the history file (concurrent-safe)."""
+        if not self._pending:
+            return
+        lines = "".join(self._pending)
+        self._pending.clear()
+        self._last_flush = time.monotonic()
         try:
-            self.history_file.parent.mkdir(parents=True, exist_ok=True)
-            with self.history_file.open("a", encoding="utf-8") as f:
-                f.write(json.dumps(text) + "\n")
+            # Another manager may have compacted the file, replacing it and
+            # leaving this handle with no links. Flushes are batched, so one
+            # fstat per flush is cheap next to losing the entries.
+            if self._file is not None and os.fstat(self._file.fileno()).st_nlink == 0:
+                self._close_file()
+            if self._file is None:
+                self.history_file.parent.mkdir(parents=True, exist_ok=True)
+                self._file = self.history_file.open("a", encoding="utf-8")
+            self._file.write(lines)
+            self._file.flush()
         except OSError:
-            pass
+            # Reopen on the next write
+            self._close_file()
+
+    def close(self) -> None:
+        """Write any buffered entries and close the history file."""
+        self.flush()
+        self._close_file()
+
+    def _close_file(self) -> None:
+        """Close the append handle, if open."""
+        if self._file is None:
+            return
+        with contextlib.suppress(OSError):
+            self._file.close()
+        self._file = None
 
     def _compact_history(self) -> None:
         """Rewrite history file to remove old entries.
 
         Only called when entries exceed 2x max_entries to minimize rewrites.
         """
+        # Buffered entries are part of what gets rewritten, and the append
+        # handle is reopened on the next write
+        self._pending.clear()
+        self._close_file()
+        # Write a uniquely named sibling temp file and swap it in, so readers
+        # and other writers (or compactions) never see a half-written file
+        tmp_path: Path | None = None
         try:
             self.history_file.parent.mkdir(parents=True, exist_ok=True)
-            with self.history_file.open("w", encoding="utf-8") as f:
-                for entry in self._entries:
-                    f.write(json.dumps(entry) + "\n")
+            with tempfile.NamedTemporaryFile(
+                "w",
+                encoding="utf-8",
+                dir=self.history_file.parent,
+                prefix=self.history_file.name + ".",
+                suffix=".tmp",
+                delete=False,
+            ) as f:
+                tmp_path = Path(f.name)
+                f.write("".join(map(_serialize_entry, self._entries)))
+            tmp_path.replace(self.history_file)
         except OSError:
-            pass
+            if tmp_path is not None:
+                with contextlib.suppress(OSError):
+                    tmp_path.unlink()
 
     def add(self, text: str) -> None:
         """Add a command to history.
@@ -86,6 +239,7 @@ class HistoryManager:
             return
 
         self._entries.append(text)
+        self._prefix_index.setdefault(text[0], []).append(len(self._entries) - 1)
 
         # Append to file (fast, concurrent-safe)
         self._append_to_file(text)
@@ -93,6 +247,7 @@ class HistoryManager:
         # Compact only when we have 2x max entries (rare operation)
         if len(self._entries) > self.max_entries * 2:
             self._entries = self._entries[-self.max_entries :]
+            self._rebuild_prefix_index()
             self._compact_history()
 
         self.reset_navigation()
@@ -116,7 +271,9 @@ class HistoryManager:
             self._current_index = len(self._entries)
 
         # Search backwards for matching entry
-        for i in range(self._current_index - 1, -1, -1):
+        indices = self._indices_for_prefix(prefix)
+        for pos in range(bisect_left(indices, self._current_index) - 1, -1, -1):
+            i = indices[pos]
             if self._entries[i].startswith(prefix):
                 self._current_index = i
                 return self._entries[i]
@@ -136,7 +293,9 @@ class HistoryManager:
             return None
 
         # Search forwards for matching entry
-        for i in range(self._current_index + 1, len(self._entries)):
+        indices = self._indices_for_prefix(prefix)
+        for pos in range(bisect_right(indices, self._current_index), len(indices)):
+            i = indices[pos]
             if self._entries[i].startswith(prefix):
                 self._current_index = i
                 return self._entries[i]
@@ -146,6 +305,18 @@ class HistoryManager:
         self.reset_navigation()
         return result
 
+    def _rebuild_prefix_index(self) -> None:
+        """Group entry indices by their first character."""
+        self._prefix_index = {}
+        for i, entry in enumerate(self._entries):
+            self._prefix_index.setdefault(entry[:1], []).append(i)
+
+    def _indices_for_prefix(self, prefix: str) -> Sequence[int]:
+        """Get the ascending indices of entries that can start with prefix."""
+        if not prefix:
+            return range(len(self._entries))
+        return self._prefix_index.get(prefix[0], [])
+
     def reset_navigation(self) -> None:
         """Reset navigation state."""
         self._current_index = -1
@@ -10,6 +10,7 @@ from textual.widgets import Static
 
 if TYPE_CHECKING:
     from textual.app import ComposeResult
+    from textual.timer import Timer
 
 
 class BrailleSpinner:
@@ -28,6 +29,9 @@ class BrailleSpinner:
         "⠏",
     )
 
+    # Frames wrapped in their color markup, built once instead of every tick
+    WRAPPED_FRAMES: ClassVar[tuple[str, ...]] = tuple(f"[#FFD800]{f}[/]" for f in FRAMES)
+
     def __init__(self) -> None:
         """Initialize spinner."""
         self._position = 0
@@ -38,6 +42,12 @@ class BrailleSpinner:
         self._position = (self._position + 1) % len(self.FRAMES)
         return frame
 
+    def next_wrapped_frame(self) -> str:
+        """Get next animation frame wrapped in its color markup."""
+        frame = self.WRAPPED_FRAMES[self._position]
+        self._position = (self._position + 1) % len(self.WRAPPED_FRAMES)
+        return frame
+
     def current_frame(self) -> str:
         """Get current frame without advancing."""
         return self.FRAMES[self._position]
@@ -91,7 +101,10 @@ class LoadingWidget(Static):
         self._status_widget: Static | None = None
         self._hint_widget: Static | None = None
         self._paused = False
+        self._timer: Timer | None = None
         self._paused_elapsed: int = 0
+        # Last elapsed seconds shown, so the hint only updates once a second
+        self._last_elapsed: int = -1
 
     def compose(self) -> ComposeResult:
         """Compose the loading widget layout."""
@@ -108,20 +121,18 @@ class LoadingWidget(Static):
     def on_mount(self) -> None:
         """Start animation on mount."""
         self._start_time = time()
-        self.set_interval(0.1, self._update_animation)
+        self._timer = self.set_interval(0.1, self._update_animation, pause=self._paused)
 
     def _update_animation(self) -> None:
         """Update spinner and elapsed time."""
-        if self._paused:
-            return
-
         if self._spinner_widget:
-            frame = self._spinner.next_frame()
-            self._spinner_widget.update(f"[#FFD800]{frame}[/]")
+            self._spinner_widget.update(self._spinner.next_wrapped_frame())
 
         if self._hint_widget and self._start_time is not None:
             elapsed = int(time() - self._start_time)
-            self._hint_widget.update(f"({elapsed}s, esc to interrupt)")
+            if elapsed != self._last_elapsed:
+                self._last_elapsed = elapsed
+                self._hint_widget.update(f"({elapsed}s, esc to interrupt)")
 
     def set_status(self, status: str) -> None:
         """Update the status text.
@@ -140,6 +151,9 @@ class LoadingWidget(Static):
             status: Status to show while paused
         """
         self._paused = True
+        # Stop waking the event loop while nothing animates
+        if self._timer is not None:
+            self._timer.pause()
         if self._start_time is not None:
             self._paused_elapsed = int(time() - self._start_time)
         self._status = status
@@ -147,12 +161,16 @@ class LoadingWidget(Static):
             self._status_widget.update(f" {status}... ")
         if self._hint_widget:
             self._hint_widget.update(f"(paused at {self._paused_elapsed}s)")
+            # Replace the paused hint on the first tick after resuming
+            self._last_elapsed = -1
         if self._spinner_widget:
             self._spinner_widget.update("[dim]⏸[/dim]")
 
     def resume(self) -> None:
         """Resume the animation."""
         self._paused = False
+        if self._timer is not None:
+            self._timer.resume()
         self._status = "Thinking"
         if self._status_widget:
             self._status_widget.update(f" {self._status}... ")
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from functools import cached_property
+from itertools import islice
 from typing import TYPE_CHECKING, Any
 
 from rich.text import Text
@@ -15,10 +17,16 @@ from deepagents_cli.widgets.diff import format_diff_textual
 
 if TYPE_CHECKING:
     from textual.app import ComposeResult
+    from textual.timer import Timer
 
 # Maximum number of tool arguments to display inline
 _MAX_INLINE_ARGS = 3
 
+# Streamed assistant text is buffered and written to the markdown stream at
+# most this often (seconds), or as soon as this many characters are pending
+_STREAM_FLUSH_DELAY = 0.08
+_STREAM_FLUSH_CHARS = 4096
+
 
 class UserMessage(Static):
     """Widget displaying a user message."""
@@ -51,14 +59,15 @@ class UserMessage(Static):
         """
         super().__init__(**kwargs)
         self._content = content
+        # Use Text object to combine styled prefix with unstyled user content.
+        # Built once here so recomposing doesn't rebuild it.
+        self._text = Text()
+        self._text.append("> ", style="bold #10b981")
+        self._text.append(content)
 
     def compose(self) -> ComposeResult:
         """Compose the user message layout."""
-        # Use Text object to combine styled prefix with unstyled user content
-        text = Text()
-        text.append("> ", style="bold #10b981")
-        text.append(self._content)
-        yield Static(text)
+        yield Static(self._text)
 
 
 class AssistantMessage(Vertical):
@@ -92,6 +101,10 @@ class AssistantMessage(Vertical):
         self._content = content
         self._markdown: Markdown | None = None
         self._stream: MarkdownStream | None = None
+        # Streamed chunks not yet written to the markdown stream
+        self._pending: list[str] = []
+        self._pending_chars = 0
+        self._flush_timer: Timer | None = None
 
     def compose(self) -> ComposeResult:
         """Compose the assistant message layout."""
@@ -117,7 +130,8 @@ class AssistantMessage(Vertical):
         """Append content to the message (for streaming).
 
         Uses MarkdownStream for smoother rendering instead of re-rendering
-        the full content on each chunk.
+        the full content on each chunk. Chunks are buffered briefly so that a
+        burst of tokens is written to the stream as one fragment.
 
         Args:
             text: Text to append
@@ -125,6 +139,32 @@ class AssistantMessage(Vertical):
         if not text:
             return
         self._content += text
+        self._pending.append(text)
+        self._pending_chars += len(text)
+        if self._pending_chars >= _STREAM_FLUSH_CHARS:
+            await self._flush_pending()
+        elif self._flush_timer is None and not text.isspace():
+            # Whitespace-only chunks (separators between words and paragraphs)
+            # wait for the next visible text, so they never trigger a render
+            # on their own
+            self._flush_timer = self.set_timer(_STREAM_FLUSH_DELAY, self._on_flush_timer)
+
+    async def _on_flush_timer(self) -> None:
+        """Write buffered chunks once the flush delay has passed."""
+        # The timer has fired, so there is nothing to stop
+        self._flush_timer = None
+        await self._flush_pending()
+
+    async def _flush_pending(self) -> None:
+        """Write buffered chunks to the markdown stream."""
+        if self._flush_timer is not None:
+            self._flush_timer.stop()
+            self._flush_timer = None
+        if not self._pending:
+            return
+        text = "".join(self._pending)
+        self._pending.clear()
+        self._pending_chars = 0
         stream = self._ensure_stream()
         await stream.write(text)
 
@@ -136,6 +176,7 @@ class AssistantMessage(Vertical):
 
     async def stop_stream(self) -> None:
         """Stop the streaming and finalize the content."""
+        await self._flush_pending()
         if self._stream is not None:
             await self._stream.stop()
             self._stream = None
@@ -242,9 +283,21 @@ class ToolCallMessage(Vertical):
         super().__init__(**kwargs)
         self._tool_name = tool_name
         self._args = args or {}
+        # Inline args are fixed for the widget's lifetime, so format them once
+        self._args_display = self._format_args()
         self._status = "pending"
         self._output: str = ""
+        # Stripped output and its truncated preview (None if it fits), derived
+        # once when the output is set so toggling doesn't recompute them
+        self._output_stripped: str = ""
+        self._output_preview: str | None = None
         self._expanded: bool = False
+        self._output_update_scheduled = False
+        # Child widgets, cached on mount so updates don't query the DOM
+        self._status_widget: Static | None = None
+        self._preview: Static | None = None
+        self._hint: Static | None = None
+        self._full: Static | None = None
 
     def compose(self) -> ComposeResult:
         """Compose the tool call message layout."""
@@ -253,12 +306,8 @@ class ToolCallMessage(Vertical):
             f"[bold yellow]Tool:[/bold yellow] {tool_label}",
             classes="tool-header",
         )
-        args = self._filtered_args()
-        if args:
-            args_str = ", ".join(f"{k}={v!r}" for k, v in list(args.items())[:_MAX_INLINE_ARGS])
-            if len(args) > _MAX_INLINE_ARGS:
-                args_str += ", ..."
-            yield Static(f"({args_str})", classes="tool-args")
+        if self._args_display:
+            yield Static(f"({self._args_display})", classes="tool-args")
         yield Static(
             "[yellow]Pending...[/yellow]",
             classes="tool-status pending",
@@ -271,13 +320,17 @@ class ToolCallMessage(Vertical):
         yield Static("", classes="tool-output", id="output-full", markup=False)
 
     def on_mount(self) -> None:
-        """Hide output areas initially."""
+        """Cache child widgets and hide output areas initially."""
         try:
-            self.query_one("#output-preview").display = False
-            self.query_one("#output-hint").display = False
-            self.query_one("#output-full").display = False
+            self._status_widget = self.query_one("#status", Static)
+            self._preview = self.query_one("#output-preview", Static)
+            self._hint = self.query_one("#output-hint", Static)
+            self._full = self.query_one("#output-full", Static)
         except NoMatches:
-            pass
+            return
+        self._preview.display = False
+        self._hint.display = False
+        self._full.display = False
 
     def set_success(self, result: str = "") -> None:
         """Mark the tool call as successful.
@@ -286,15 +339,13 @@ class ToolCallMessage(Vertical):
             result: Tool output/result to display
         """
         self._status = "success"
-        self._output = result
-        try:
-            status = self.query_one("#status", Static)
+        self._set_output(result)
+        status = self._status_widget
+        if status is not None:
             status.remove_class("pending", "error")
             status.add_class("success")
             status.update("[green]✓ Success[/green]")
-        except NoMatches:
-            pass
-        self._update_output_display()
+        self._schedule_output_update()
 
     def set_error(self, error: str) -> None:
         """Mark the tool call as failed.
@@ -303,34 +354,51 @@ class ToolCallMessage(Vertical):
             error: Error message
         """
         self._status = "error"
-        self._output = error
-        try:
-            status = self.query_one("#status", Static)
+        self._set_output(error)
+        status = self._status_widget
+        if status is not None:
             status.remove_class("pending", "success")
             status.add_class("error")
             status.update("[red]✗ Error[/red]")
-        except NoMatches:
-            pass
         # Always show full error - errors should be visible
         self._expanded = True
-        self._update_output_display()
+        self._schedule_output_update()
 
     def set_rejected(self) -> None:
         """Mark the tool call as rejected by user."""
         self._status = "rejected"
-        try:
-            status = self.query_one("#status", Static)
+        status = self._status_widget
+        if status is not None:
             status.remove_class("pending", "success", "error")
             status.add_class("rejected")
             status.update("[yellow]✗ Rejected[/yellow]")
-        except NoMatches:
-            pass
+
+    def _set_output(self, output: str) -> None:
+        """Store tool output along with its stripped form and preview."""
+        self._output = output
+        self._output_stripped = output.strip()
+        self._output_preview = self._truncated_preview(self._output_stripped)
 
     def toggle_output(self) -> None:
         """Toggle between preview and full output display."""
         if not self._output:
             return
         self._expanded = not self._expanded
+        self._schedule_output_update()
+
+    def _schedule_output_update(self) -> None:
+        """Update the output display once pending messages are processed.
+
+        Back-to-back changes, such as set_success followed by toggle_output,
+        are collapsed into a single update.
+        """
+        if not self._output_update_scheduled:
+            self._output_update_scheduled = True
+            self.call_after_refresh(self._run_output_update)
+
+    def _run_output_update(self) -> None:
+        """Run a scheduled output display update."""
+        self._output_update_scheduled = False
         self._update_output_display()
 
     def _update_output_display(self) -> None:
@@ -338,63 +406,80 @@ class ToolCallMessage(Vertical):
         if not self._output:
             return
 
-        try:
-            preview = self.query_one("#output-preview", Static)
-            hint = self.query_one("#output-hint", Static)
-            full = self.query_one("#output-full", Static)
-
-            output_stripped = self._output.strip()
-            lines = output_stripped.split("\n")
-            total_lines = len(lines)
-            total_chars = len(output_stripped)
-
-            # Truncate if too many lines OR too many characters
-            needs_truncation = (
-                total_lines > self._PREVIEW_LINES or total_chars > self._PREVIEW_CHARS
-            )
-
-            if self._expanded:
-                # Show full output
-                preview.display = False
+        preview, hint, full = self._preview, self._hint, self._full
+        if preview is None or hint is None or full is None:
+            return
+
+        output_stripped = self._output_stripped
+        preview_text = self._output_preview
+
+        if self._expanded:
+            # Show full output
+            preview.display = False
+            hint.display = False
+            full.update(self._output)
+            full.display = True
+        else:
+            # Show preview
+            full.display = False
+            if preview_text is not None:
+                preview.update(preview_text)
+                preview.display = True
+
+                # Show expand hint
+                hint.update("[dim]... (Ctrl+O to expand)[/dim]")
+                hint.display = True
+            elif output_stripped:
+                # Output fits in preview, just show it
+                preview.update(output_stripped)
+                preview.display = True
                 hint.display = False
-                full.update(self._output)
-                full.display = True
             else:
-                # Show preview
-                full.display = False
-                if needs_truncation:
-                    # Truncate by lines first, then by chars
-                    if total_lines > self._PREVIEW_LINES:
-                        preview_text = "\n".join(lines[: self._PREVIEW_LINES])
-                    else:
-                        preview_text = output_stripped
-
-                    # Also truncate by chars if still too long
-                    if len(preview_text) > self._PREVIEW_CHARS:
-                        preview_text = preview_text[: self._PREVIEW_CHARS] + "..."
-
-                    preview.update(preview_text)
-                    preview.display = True
-
-                    # Show expand hint
-                    hint.update("[dim]... (Ctrl+O to expand)[/dim]")
-                    hint.display = True
-                elif output_stripped:
-                    # Output fits in preview, just show it
-                    preview.update(output_stripped)
-                    preview.display = True
-                    hint.display = False
-                else:
-                    preview.display = False
-                    hint.display = False
-        except NoMatches:
-            pass
+                preview.display = False
+                hint.display = False
+
+    def _truncated_preview(self, text: str) -> str | None:
+        """Truncate text to the preview limits.
+
+        Only scans as far as the preview reaches, so long output is never
+        split into lines.
+
+        Args:
+            text: Stripped tool output
+
+        Returns:
+            The truncated preview, or None if text fits in the preview
+        """
+        # Truncate by lines first: find the end of the last preview line,
+        # which stays -1 if text doesn't have more lines than that
+        end = -1
+        for _ in range(self._PREVIEW_LINES):
+            end = text.find("\n", end + 1)
+            if end == -1:
+                break
+        if end == -1:
+            if len(text) <= self._PREVIEW_CHARS:
+                return None
+            end = len(text)
+
+        # Also truncate by chars if still too long
+        if end > self._PREVIEW_CHARS:
+            return text[: self._PREVIEW_CHARS] + "..."
+        return text[:end]
 
     @property
     def has_output(self) -> bool:
         """Check if this tool message has output to display."""
         return bool(self._output)
 
+    def _format_args(self) -> str:
+        """Format the filtered tool args for inline display, or "" if there are none."""
+        args = self._filtered_args()
+        args_str = ", ".join(f"{k}={v!r}" for k, v in islice(args.items(), _MAX_INLINE_ARGS))
+        if len(args) > _MAX_INLINE_ARGS:
+            args_str += ", ..."
+        return args_str
+
     def _filtered_args(self) -> dict[str, Any]:
         """Filter large tool args for display."""
         if self._tool_name not in {"write_file", "edit_file"}:
@@ -456,14 +541,17 @@ class DiffMessage(Static):
         self._diff_content = diff_content
         self._file_path = file_path
 
+    @cached_property
+    def _rendered(self) -> str:
+        """Diff with enhanced formatting, rendered once per widget."""
+        return format_diff_textual(self._diff_content, max_lines=100)
+
     def compose(self) -> ComposeResult:
         """Compose the diff message layout."""
         if self._file_path:
             yield Static(f"[bold]File: {self._file_path}[/bold]", classes="diff-header")
 
-        # Render the diff with enhanced formatting
-        rendered = format_diff_textual(self._diff_content, max_lines=100)
-        yield Static(rendered)
+        yield Static(self._rendered)
 
 
 class ErrorMessage(Static):
@@ -12,6 +12,17 @@ from textual.widgets import Static
 
 if TYPE_CHECKING:
     from textual.app import ComposeResult
+    from textual.timer import Timer
+
+# Token count and status message changes are shown at most this often (seconds)
+_UPDATE_INTERVAL = 0.1
+
+
+def _is_busy_status(message: str) -> bool:
+    """Whether a status message reports the agent thinking or running a tool."""
+    # Lowercase once for both checks
+    lowered = message.lower()
+    return "thinking" in lowered or "executing" in lowered
 
 
 class StatusBar(Horizontal):
@@ -99,6 +110,17 @@ class StatusBar(Horizontal):
         super().__init__(**kwargs)
         # Store initial cwd - will be used in compose()
         self._initial_cwd = str(cwd) if cwd else str(Path.cwd())
+        # Throttling state for token and status message updates
+        self._tokens_dirty = False
+        self._status_dirty = False
+        self._update_timer: Timer | None = None
+        # Child widgets, cached on mount so updates don't query the DOM
+        self._mode_indicator: Static | None = None
+        self._auto_approve_indicator: Static | None = None
+        self._message_display: Static | None = None
+        self._tokens_display: Static | None = None
+        # Text currently shown in the token display
+        self._tokens_text = ""
 
     def compose(self) -> ComposeResult:
         """Compose the status bar layout."""
@@ -113,16 +135,20 @@ class StatusBar(Horizontal):
         # CWD shown in welcome banner, not pinned in status bar
 
     def on_mount(self) -> None:
-        """Set reactive values after mount to trigger watchers safely."""
+        """Cache child widgets and set reactive values to trigger watchers safely."""
+        self._mode_indicator = self.query_one("#mode-indicator", Static)
+        self._auto_approve_indicator = self.query_one("#auto-approve-indicator", Static)
+        self._message_display = self.query_one("#status-message", Static)
+        self._tokens_display = self.query_one("#tokens-display", Static)
         self.cwd = self._initial_cwd
 
     def watch_mode(self, mode: str) -> None:
         """Update mode indicator when mode changes."""
-        try:
-            indicator = self.query_one("#mode-indicator", Static)
-        except NoMatches:
+        indicator = self._mode_indicator
+        if indicator is None:
             return
-        indicator.remove_class("normal", "bash", "command")
+        # Restyle once, when the new class is added
+        indicator.remove_class("normal", "bash", "command", update=False)
 
         if mode == "bash":
             indicator.update("BASH")
@@ -136,11 +162,11 @@ class StatusBar(Horizontal):
 
     def watch_auto_approve(self, new_value: bool) -> None:  # noqa: FBT001
         """Update auto-approve indicator when state changes."""
-        try:
-            indicator = self.query_one("#auto-approve-indicator", Static)
-        except NoMatches:
+        indicator = self._auto_approve_indicator
+        if indicator is None:
             return
-        indicator.remove_class("on", "off")
+        # Restyle once, when the new class is added
+        indicator.remove_class("on", "off", update=False)
 
         if new_value:
             indicator.update("auto | shift+tab to cycle")
@@ -157,20 +183,46 @@ class StatusBar(Horizontal):
             return
         display.update(self._format_cwd(new_value))
 
-    def watch_status_message(self, new_value: str) -> None:
-        """Update status message display."""
-        try:
-            msg_widget = self.query_one("#status-message", Static)
-        except NoMatches:
+    def watch_status_message(self, new_value: str) -> None:  # noqa: ARG002
+        """Update status message display, throttled to _UPDATE_INTERVAL."""
+        self._status_dirty = True
+        self._schedule_update()
+
+    def _schedule_update(self) -> None:
+        """Show pending changes now, or when the current interval ends.
+
+        The first change is shown immediately; changes arriving within the
+        following interval are collapsed into a single update at its end.
+        """
+        if self._update_timer is None:
+            self._apply_updates()
+            self._update_timer = self.set_timer(_UPDATE_INTERVAL, self._end_update_interval)
+
+    def _end_update_interval(self) -> None:
+        """Show changes that arrived during the interval that just ended."""
+        self._update_timer = None
+        if self._tokens_dirty or self._status_dirty:
+            self._schedule_update()
+
+    def _apply_updates(self) -> None:
+        """Update the token and status message displays if they changed."""
+        if self._tokens_dirty:
+            self._tokens_dirty = False
+            self._render_tokens(self.tokens)
+        if self._status_dirty:
+            self._status_dirty = False
+            self._render_status_message(self.status_message)
+
+    def _render_status_message(self, new_value: str) -> None:
+        """Show a status message."""
+        msg_widget = self._message_display
+        if msg_widget is None:
             return
 
-        msg_widget.remove_class("thinking")
-        if new_value:
-            msg_widget.update(new_value)
-            if "thinking" in new_value.lower() or "executing" in new_value.lower():
-                msg_widget.add_class("thinking")
-        else:
-            msg_widget.update("")
+        msg_widget.update(new_value)
+        # Only restyles when the class actually changes, e.g. not when going
+        # from thinking to executing a tool
+        msg_widget.set_class(_is_busy_status(new_value), "thinking")
 
     def _format_cwd(self, cwd_path: str = "") -> str:
         """Format the current working directory for display."""
@@ -208,21 +260,29 @@ class StatusBar(Horizontal):
         """
         self.status_message = message
 
-    def watch_tokens(self, new_value: int) -> None:
-        """Update token display when count changes."""
-        try:
-            display = self.query_one("#tokens-display", Static)
-        except NoMatches:
+    def watch_tokens(self, new_value: int) -> None:  # noqa: ARG002
+        """Update token display when count changes, throttled to _UPDATE_INTERVAL."""
+        self._tokens_dirty = True
+        self._schedule_update()
+
+    def _render_tokens(self, new_value: int) -> None:
+        """Show a token count."""
+        display = self._tokens_display
+        if display is None:
             return
 
-        if new_value > 0:
-            # Format with K suffix for thousands
-            if new_value >= 1000:
-                display.update(f"{new_value / 1000:.1f}K tokens")
-            else:
-                display.update(f"{new_value} tokens")
+        # Format with K suffix for thousands
+        if new_value >= 1000:
+            text = f"{new_value / 1000:.1f}K tokens"
+        elif new_value > 0:
+            text = f"{new_value} tokens"
         else:
-            display.update("")
+            text = ""
+
+        # Counts that round to the same text don't need a repaint
+        if text != self._tokens_text:
+            self._tokens_text = text
+            display.update(text)
 
     def set_tokens(self, count: int) -> None:
         """Set the token count.
@@ -234,4 +294,8 @@ class StatusBar(Horizontal):
 
     def hide_tokens(self) -> None:
         """Hide the token display (e.g., during streaming)."""
-        self.query_one("#tokens-display", Static).update("")
+        # Drop any throttled count so it doesn't reappear once the interval ends
+        self._tokens_dirty = False
+        if self._tokens_display is not None:
+            self._tokens_text = ""
+            self._tokens_display.update("")
@@ -113,13 +113,16 @@ class BashRenderer(ToolRenderer):
         return BashApprovalWidget, data
 
 
-# Registry mapping tool names to renderers
-_RENDERER_REGISTRY: dict[str, type[ToolRenderer]] = {
-    "write_file": WriteFileRenderer,
-    "edit_file": EditFileRenderer,
-    "bash": BashRenderer,
-    "shell": BashRenderer,
+# Registry mapping tool names to renderers. Renderers are stateless, so each
+# one is created once and shared.
+_BASH_RENDERER = BashRenderer()
+_RENDERER_REGISTRY: dict[str, ToolRenderer] = {
+    "write_file": WriteFileRenderer(),
+    "edit_file": EditFileRenderer(),
+    "bash": _BASH_RENDERER,
+    "shell": _BASH_RENDERER,
 }
+_DEFAULT_RENDERER = ToolRenderer()
 
 
 def get_renderer(tool_name: str) -> ToolRenderer:
@@ -131,5 +134,4 @@ def get_renderer(tool_name: str) -> ToolRenderer:
     Returns:
         The appropriate ToolRenderer instance
     """
-    renderer_class = _RENDERER_REGISTRY.get(tool_name, ToolRenderer)
-    return renderer_class()
+    return _RENDERER_REGISTRY.get(tool_name, _DEFAULT_RENDERER)
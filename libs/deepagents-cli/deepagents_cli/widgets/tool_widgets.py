@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
+from rich.text import Text
 from textual.containers import Vertical
 from textual.widgets import Markdown, Static
 
@@ -16,10 +17,12 @@ _MAX_LINES = 30
 _MAX_DIFF_LINES = 50
 _MAX_PREVIEW_LINES = 20
 
-
-def _escape_markup(text: str) -> str:
-    """Escape Rich markup characters in text."""
-    return text.replace("[", r"\[").replace("]", r"\]")
+# Shown marker and style for diff lines, keyed by the line's +/-/space marker
+_DIFF_LINE_STYLES = {
+    "-": ("- ", "red on #3d1f1f"),
+    "+": ("+ ", "green on #1f3d1f"),
+    " ": ("  ", "dim"),
+}
 
 
 class ToolApprovalWidget(Vertical):
@@ -40,6 +43,7 @@ class GenericApprovalWidget(ToolApprovalWidget):
 
     def compose(self) -> ComposeResult:
         """Compose the generic tool display."""
+        lines = []
         for key, value in self.data.items():
             if value is None:
                 continue
@@ -47,7 +51,10 @@ class GenericApprovalWidget(ToolApprovalWidget):
             if len(value_str) > _MAX_VALUE_LEN:
                 hidden = len(value_str) - _MAX_VALUE_LEN
                 value_str = value_str[:_MAX_VALUE_LEN] + f"... ({hidden} more chars)"
-            yield Static(f"{key}: {value_str}", markup=False, classes="approval-description")
+            lines.append(Text(f"{key}: {value_str}"))
+        # All args share one Static rather than a widget per arg
+        if lines:
+            yield Static(Text("\n").join(lines), classes="approval-description")
 
 
 class WriteFileApprovalWidget(ToolApprovalWidget):
@@ -63,15 +70,14 @@ class WriteFileApprovalWidget(ToolApprovalWidget):
         yield Static(f"File: {file_path}", markup=False, classes="approval-file-path")
         yield Static("")
 
-        # Content with syntax highlighting via Markdown code block
-        lines = content.split("\n")
-        total_lines = len(lines)
+        # Content with syntax highlighting via Markdown code block. Only the
+        # shown lines are split off; the rest stays in one tail that is counted.
+        lines = content.split("\n", _MAX_LINES)
 
-        if total_lines > _MAX_LINES:
+        if len(lines) > _MAX_LINES:
             # Truncate for display
-            shown_lines = lines[:_MAX_LINES]
-            remaining = total_lines - _MAX_LINES
-            truncated_content = "\n".join(shown_lines) + f"\n... ({remaining} more lines)"
+            remaining = lines.pop().count("\n") + 1
+            truncated_content = "\n".join(lines) + f"\n... ({remaining} more lines)"
             yield Markdown(f"```{file_extension}\n{truncated_content}\n```")
         else:
             yield Markdown(f"```{file_extension}\n{content}\n```")
@@ -128,12 +134,16 @@ class EditFileApprovalWidget(ToolApprovalWidget):
     ) -> tuple[int, int]:
         """Count additions and deletions from diff data."""
         if diff_lines:
-            additions = sum(
-                1 for line in diff_lines if line.startswith("+") and not line.startswith("+++")
-            )
-            deletions = sum(
-                1 for line in diff_lines if line.startswith("-") and not line.startswith("---")
-            )
+            # One pass, dispatching on the first character; the header check
+            # only runs for lines that already start with + or -
+            additions = deletions = 0
+            for line in diff_lines:
+                first = line[:1]
+                if first == "+":
+                    if line[:3] != "+++":
+                        additions += 1
+                elif first == "-" and line[:3] != "---":
+                    deletions += 1
         else:
             additions = new_string.count("\n") + 1 if new_string else 0
             deletions = old_string.count("\n") + 1 if old_string else 0
@@ -150,20 +160,23 @@ class EditFileApprovalWidget(ToolApprovalWidget):
 
     def _render_diff_lines_only(self, diff_lines: list[str]) -> ComposeResult:
         """Render unified diff lines without returning stats."""
-        lines_shown = 0
+        rendered: list[Text] = []
 
         for line in diff_lines:
-            if lines_shown >= _MAX_DIFF_LINES:
-                yield Static(f"[dim]... ({len(diff_lines) - lines_shown} more lines)[/dim]")
+            if len(rendered) >= _MAX_DIFF_LINES:
+                hidden = len(diff_lines) - len(rendered)
+                rendered.append(Text.styled(f"... ({hidden} more lines)", "dim"))
                 break
 
             if line.startswith(("@@", "---", "+++")):
                 continue
 
-            widget = self._render_diff_line(line)
-            if widget:
-                yield widget
-                lines_shown += 1
+            content = self._render_diff_line(line)
+            if content is not None:
+                rendered.append(content)
+
+        if rendered:
+            yield self._lines_widget(rendered)
 
     def _render_strings_only(self, old_string: str, new_string: str) -> ComposeResult:
         """Render old/new strings without returning stats."""
@@ -176,33 +189,35 @@ class EditFileApprovalWidget(ToolApprovalWidget):
             yield Static("[bold green]Adding:[/bold green]")
             yield from self._render_string_lines(new_string, is_addition=True)
 
-    def _render_diff_line(self, line: str) -> Static | None:
+    def _render_diff_line(self, line: str) -> Text | None:
         """Render a single diff line with appropriate styling."""
-        content = _escape_markup(line[1:] if len(line) > 1 else "")
-
-        if line.startswith("-"):
-            return Static(f"[on #3d1f1f][red]- {content}[/red][/on #3d1f1f]")
-        if line.startswith("+"):
-            return Static(f"[on #1f3d1f][green]+ {content}[/green][/on #1f3d1f]")
-        if line.startswith(" "):
-            return Static(f"[dim]  {content}[/dim]")
+        # One lookup on the first character picks the styling. The line text is
+        # styled as-is, so it needs no escaping and no markup parsing.
+        marker_style = _DIFF_LINE_STYLES.get(line[:1])
+        if marker_style is not None:
+            marker, style = marker_style
+            return Text.styled(f"{marker}{line[1:]}", style)
         if line.strip():
-            return Static(line, markup=False)
+            return Text(line)
         return None
 
+    def _lines_widget(self, lines: list[Text]) -> Static:
+        """Show rendered lines in one Static rather than a widget per line."""
+        # Each line is styled on its own, so styles can't leak between lines
+        return Static(Text("\n").join(lines))
+
     def _render_string_lines(self, text: str, *, is_addition: bool) -> ComposeResult:
         """Render lines from a string with appropriate styling."""
-        lines = text.split("\n")
-        style = "[on #1f3d1f][green]+" if is_addition else "[on #3d1f1f][red]-"
-        end_style = "[/green][/on #1f3d1f]" if is_addition else "[/red][/on #3d1f1f]"
-
-        for line in lines[:_MAX_PREVIEW_LINES]:
-            escaped = _escape_markup(line)
-            yield Static(f"{style} {escaped}{end_style}")
-
-        if len(lines) > _MAX_PREVIEW_LINES:
-            remaining = len(lines) - _MAX_PREVIEW_LINES
-            yield Static(f"[dim]... ({remaining} more lines)[/dim]")
+        # Split off only the lines that are shown; anything past them stays in
+        # one unsplit tail that is just counted
+        lines = text.split("\n", _MAX_PREVIEW_LINES)
+        remaining = lines.pop().count("\n") + 1 if len(lines) > _MAX_PREVIEW_LINES else 0
+        marker, style = _DIFF_LINE_STYLES["+" if is_addition else "-"]
+
+        rendered = [Text.styled(f"{marker}{line}", style) for line in lines]
+        if remaining:
+            rendered.append(Text.styled(f"... ({remaining} more lines)", "dim"))
+        yield self._lines_widget(rendered)
 
 
 class BashApprovalWidget(ToolApprovalWidget):
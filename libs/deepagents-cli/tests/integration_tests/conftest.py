@@ -12,7 +12,7 @@ def langsmith_client() -> Generator[Client | None, None, None]:
     """Create a LangSmith client if LANGSMITH_API_KEY is set.
 
     This fixture is session-scoped and automatically used by all tests.
-    It creates a single client instance and ensures it's flushed after each test.
+    It creates a single client instance and ensures it's flushed after each test module.
     """
     langsmith_api_key = os.environ.get("LANGSMITH_API_KEY") or os.environ.get("LANGCHAIN_API_KEY")
 
@@ -26,11 +26,15 @@ def langsmith_client() -> Generator[Client | None, None, None]:
         yield None
 
 
-@pytest.fixture(autouse=True)
-def flush_langsmith_after_test(langsmith_client: Client) -> Generator[None, None, None]:
-    """Automatically flush LangSmith client after each test."""
+@pytest.fixture(scope="module", autouse=True)
+def flush_langsmith_after_module(langsmith_client: Client) -> Generator[None, None, None]:
+    """Automatically flush LangSmith client after each test module.
+
+    The client sends traces in the background, so flushing per test would only
+    block on its queue between tests.
+    """
     yield
 
-    # This runs after each test
+    # This runs after the last test in the module
     if langsmith_client is not None:
         langsmith_client.flush()
@@ -5,8 +5,12 @@ optional sandbox reuse to reduce test execution time.
 
 Set REUSE_SANDBOX=1 environment variable to reuse sandboxes across tests within
 a class. Otherwise, a fresh sandbox is created for each test method.
+
+Each test writes to its own paths, so the suite can run under pytest-xdist with
+`--dist loadgroup`; every backend is pinned to one worker so its sandbox is shared.
 """
 
+import uuid
 from abc import ABC, abstractmethod
 from collections.abc import Iterator
 
@@ -17,6 +21,11 @@ from deepagents.backends.sandbox import BaseSandbox
 from deepagents_cli.integrations.sandbox_factory import create_sandbox
 
 
+def _unique_path(name: str) -> str:
+    """Return a path under /tmp that no other test run will use."""
+    return f"/tmp/{uuid.uuid4().hex}_{name}"
+
+
 class BaseSandboxIntegrationTest(ABC):
     """Base class for sandbox integration tests.
 
@@ -30,6 +39,19 @@ class BaseSandboxIntegrationTest(ABC):
         """Provide a sandbox instance for testing."""
         ...
 
+    @pytest.fixture(scope="class")
+    def seeded_files(self, sandbox: SandboxBackendProtocol) -> list[tuple[str, bytes]]:
+        """Upload the files the download tests read, in a single batch per class."""
+        files = [
+            (_unique_path("test_download_single.txt"), b"Download test content"),
+            (_unique_path("test_batch_1.txt"), b"Batch 1"),
+            (_unique_path("test_batch_2.txt"), b"Batch 2"),
+            (_unique_path("test_batch_3.txt"), b"Batch 3"),
+        ]
+        upload_responses = sandbox.upload_files(files)
+        assert all(resp.error is None for resp in upload_responses)
+        return files
+
     def test_sandbox_creation(self, sandbox: SandboxBackendProtocol) -> None:
         """Test basic sandbox creation and command execution."""
         assert sandbox.id is not None
@@ -38,7 +60,7 @@ class BaseSandboxIntegrationTest(ABC):
 
     def test_upload_single_file(self, sandbox: SandboxBackendProtocol) -> None:
         """Test uploading a single file."""
-        test_path = "/tmp/test_upload_single.txt"
+        test_path = _unique_path("test_upload_single.txt")
         test_content = b"Hello, Sandbox!"
         upload_responses = sandbox.upload_files([(test_path, test_content)])
 
@@ -50,12 +72,11 @@ class BaseSandboxIntegrationTest(ABC):
         result = sandbox.execute(f"cat {test_path}")
         assert result.output.strip() == test_content.decode()
 
-    def test_download_single_file(self, sandbox: SandboxBackendProtocol) -> None:
+    def test_download_single_file(
+        self, sandbox: SandboxBackendProtocol, seeded_files: list[tuple[str, bytes]]
+    ) -> None:
         """Test downloading a single file."""
-        test_path = "/tmp/test_download_single.txt"
-        test_content = b"Download test content"
-        # Create file first
-        sandbox.upload_files([(test_path, test_content)])
+        test_path, test_content = seeded_files[0]
 
         # Download and verify
         download_responses = sandbox.download_files([test_path])
@@ -67,7 +88,7 @@ class BaseSandboxIntegrationTest(ABC):
 
     def test_upload_download_roundtrip(self, sandbox: SandboxBackendProtocol) -> None:
         """Test upload followed by download for data integrity."""
-        test_path = "/tmp/test_roundtrip.txt"
+        test_path = _unique_path("test_roundtrip.txt")
         test_content = b"Roundtrip test: special chars \n\t\r\x00"
 
         # Upload
@@ -82,9 +103,9 @@ class BaseSandboxIntegrationTest(ABC):
     def test_upload_multiple_files(self, sandbox: SandboxBackendProtocol) -> None:
         """Test uploading multiple files in a single batch."""
         files = [
-            ("/tmp/test_multi_1.txt", b"Content 1"),
-            ("/tmp/test_multi_2.txt", b"Content 2"),
-            ("/tmp/test_multi_3.txt", b"Content 3"),
+            (_unique_path("test_multi_1.txt"), b"Content 1"),
+            (_unique_path("test_multi_2.txt"), b"Content 2"),
+            (_unique_path("test_multi_3.txt"), b"Content 3"),
         ]
 
         upload_responses = sandbox.upload_files(files)
@@ -94,16 +115,11 @@ class BaseSandboxIntegrationTest(ABC):
             assert resp.path == files[i][0]
             assert resp.error is None
 
-    def test_download_multiple_files(self, sandbox: SandboxBackendProtocol) -> None:
+    def test_download_multiple_files(
+        self, sandbox: SandboxBackendProtocol, seeded_files: list[tuple[str, bytes]]
+    ) -> None:
         """Test downloading multiple files in a single batch."""
-        files = [
-            ("/tmp/test_batch_1.txt", b"Batch 1"),
-            ("/tmp/test_batch_2.txt", b"Batch 2"),
-            ("/tmp/test_batch_3.txt", b"Batch 3"),
-        ]
-
-        # Upload files first
-        sandbox.upload_files(files)
+        files = seeded_files[1:]
 
         # Download all at once
         paths = [f[0] for f in files]
@@ -129,7 +145,7 @@ class BaseSandboxIntegrationTest(ABC):
 
     def test_upload_binary_content(self, sandbox: SandboxBackendProtocol) -> None:
         """Test uploading binary content (not valid UTF-8)."""
-        test_path = "/tmp/binary_file.bin"
+        test_path = _unique_path("binary_file.bin")
         # Create binary content with all byte values
         test_content = bytes(range(256))
 
@@ -145,8 +161,8 @@ class BaseSandboxIntegrationTest(ABC):
     def test_partial_success_upload(self, sandbox: SandboxBackendProtocol) -> None:
         """Test that batch upload supports partial success."""
         files = [
-            ("/tmp/valid_upload.txt", b"Valid content"),
-            ("/tmp/another_valid.txt", b"Another valid"),
+            (_unique_path("valid_upload.txt"), b"Valid content"),
+            (_unique_path("another_valid.txt"), b"Another valid"),
         ]
 
         upload_responses = sandbox.upload_files(files)
@@ -292,6 +308,7 @@ class BaseSandboxIntegrationTest(ABC):
         # Behavior depends on implementation - just verify we get a response
 
 
+@pytest.mark.xdist_group(name="sandbox-runloop")
 class TestRunLoopIntegration(BaseSandboxIntegrationTest):
     """Test RunLoop backend integration."""
 
@@ -302,6 +319,7 @@ class TestRunLoopIntegration(BaseSandboxIntegrationTest):
             yield sandbox
 
 
+@pytest.mark.xdist_group(name="sandbox-daytona")
 class TestDaytonaIntegration(BaseSandboxIntegrationTest):
     """Test Daytona backend integration."""
 
@@ -312,6 +330,7 @@ class TestDaytonaIntegration(BaseSandboxIntegrationTest):
             yield sandbox
 
 
+@pytest.mark.xdist_group(name="sandbox-modal")
 class TestModalIntegration(BaseSandboxIntegrationTest):
     """Test Modal backend integration."""
 
@@ -40,6 +40,7 @@ class TestValidateSkillName:
             ("-skill", "cannot start with hyphen"),
             ("skill-", "cannot end with hyphen"),
             ("skill--name", "consecutive hyphens not allowed"),
+            ("skill\n", "trailing newline not allowed"),
         ]
         for name, reason in invalid_names:
             is_valid, error = _validate_name(name)
@@ -186,6 +187,29 @@ class TestValidateSkillPath:
         assert is_valid, f"Valid non-existent path was rejected: {error}"
         assert error == ""
 
+    def test_parent_reference_with_missing_base(self, tmp_path: Path) -> None:
+        """Test that base_dir / ".." is blocked even before base_dir exists."""
+        base_dir = tmp_path / "skills"
+
+        is_valid, error = _validate_skill_path(base_dir / "..", base_dir)
+        assert not is_valid, "Parent of base directory was accepted"
+        assert error != ""
+
+    def test_dangling_symlink_outside_base(self, tmp_path: Path) -> None:
+        """Test that a symlink to a missing target outside base is blocked."""
+        base_dir = tmp_path / "skills"
+        base_dir.mkdir()
+
+        symlink_path = base_dir / "evil-link"
+        try:
+            symlink_path.symlink_to(tmp_path / "outside")
+        except OSError:
+            pytest.skip("Symlink creation not supported")
+
+        is_valid, error = _validate_skill_path(symlink_path, base_dir)
+        assert not is_valid, "Dangling symlink to outside directory was accepted"
+        assert error != ""
+
 
 class TestIntegrationSecurity:
     """Integration tests for security across the command flow."""
@@ -0,0 +1,60 @@
+# Copyright (c) 2025 Harrison Chase
+"""Tests for the approval menu."""
+
+import asyncio
+import threading
+from typing import Any
+
+import pytest
+from textual.app import App, ComposeResult
+from textual.widgets import Static
+
+from deepagents_cli.widgets.approval import ApprovalMenu
+from deepagents_cli.widgets.tool_widgets import GenericApprovalWidget
+
+
+class _BlockingRenderer:
+    """Renderer that doesn't finish until released."""
+
+    def __init__(self) -> None:
+        self.release = threading.Event()
+        self.finished = threading.Event()
+
+    def get_approval_widget(self, tool_args: dict[str, Any]) -> tuple[type, dict[str, Any]]:
+        self.release.wait(5)
+        self.finished.set()
+        return GenericApprovalWidget, tool_args
+
+
+class _ApprovalApp(App):
+    def compose(self) -> ComposeResult:
+        yield ApprovalMenu({"name": "edit_file", "args": {"file_path": "a.py"}})
+
+
+class TestApprovalMenu:
+    """Test the approval menu while tool info is loading."""
+
+    @pytest.mark.asyncio
+    async def test_options_work_before_tool_info_renders(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Options are shown and quick keys work while the renderer is still busy."""
+        renderer = _BlockingRenderer()
+        monkeypatch.setattr("deepagents_cli.widgets.approval.get_renderer", lambda _name: renderer)
+        try:
+            async with _ApprovalApp().run_test() as pilot:
+                menu = pilot.app.query_one(ApprovalMenu)
+                future: asyncio.Future[dict[str, str]] = asyncio.get_running_loop().create_future()
+                menu.set_future(future)
+                await pilot.pause()
+
+                assert not renderer.finished.is_set()
+                options = menu.query(".approval-option").results(Static)
+                assert str(next(options).content).endswith("1. Approve (y)")
+                assert menu.has_focus
+
+                await pilot.press("n")
+
+                assert future.result() == {"type": "reject"}
+        finally:
+            renderer.release.set()
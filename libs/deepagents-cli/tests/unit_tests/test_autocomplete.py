@@ -1,5 +1,12 @@
+# Copyright (c) 2025 Harrison Chase
 """Tests for autocomplete fuzzy search functionality."""
 
+import asyncio
+import os
+import shutil
+import subprocess
+from difflib import SequenceMatcher
+from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
@@ -9,63 +16,65 @@ from deepagents_cli.widgets.autocomplete import (
     FuzzyFileController,
     MultiCompletionManager,
     SlashCommandController,
+    _file_type_hint,
+    _FileIndex,
     _find_project_root,
-    _fuzzy_score,
-    _fuzzy_search,
+    _get_project_files,
     _is_dotpath,
     _path_depth,
+    _score_filename_similarity,
+    _walk_project_files,
 )
 
 
-class TestFuzzyScore:
-    """Tests for the _fuzzy_score function."""
+class TestSearchRanking:
+    """Tests for how _FileIndex.search orders matches."""
 
-    def test_exact_filename_match_at_start(self):
-        """Exact match at start of filename gets highest score."""
-        score = _fuzzy_score("main", "src/main.py")
-        assert score > 140  # Should be ~150
+    def test_filename_start_ranked_above_filename_middle(self):
+        """A match at the start of the filename beats one later in the filename."""
+        results = _FileIndex(["src/remain.py", "src/main_entrypoint.py"]).search("main")
+        assert results == ["src/main_entrypoint.py", "src/remain.py"]
 
-    def test_exact_filename_match_anywhere(self):
-        """Exact match anywhere in filename."""
-        score = _fuzzy_score("test", "src/my_test_file.py")
-        assert score > 90  # Should be ~100
+    def test_word_boundary_ranked_above_middle(self):
+        """A match after _, - or . in the filename beats one mid-word."""
+        results = _FileIndex(["src/mytest.py", "src/my_test_case.py"]).search("test")
+        assert results == ["src/my_test_case.py", "src/mytest.py"]
 
-    def test_word_boundary_match(self):
-        """Match at word boundary (after _, -, .) gets bonus."""
-        score_boundary = _fuzzy_score("test", "src/my_test.py")
-        score_middle = _fuzzy_score("est", "src/mytest.py")
-        assert score_boundary > score_middle
+    def test_path_match_ranked_below_filename_match(self):
+        """A match in a directory name ranks below a match in the filename."""
+        results = _FileIndex(["src/utils/helper.py", "lib/deep/utils.py"]).search("utils")
+        assert results == ["lib/deep/utils.py", "src/utils/helper.py"]
 
-    def test_path_match_lower_than_filename(self):
-        """Match in path scores lower than filename match."""
-        filename_score = _fuzzy_score("utils", "utils.py")
-        path_score = _fuzzy_score("utils", "src/utils/helper.py")
-        assert filename_score > path_score
-
-    def test_no_match_returns_low_score(self):
-        """Completely unrelated strings get very low scores."""
-        score = _fuzzy_score("xyz", "abc.py")
-        assert score < 15  # Below MIN_FUZZY_SCORE threshold
+    def test_no_match_returns_nothing(self):
+        """Completely unrelated paths are not suggested."""
+        assert _FileIndex(["abc.py"]).search("xyz") == []
 
     def test_case_insensitive(self):
         """Matching is case insensitive."""
-        score_lower = _fuzzy_score("main", "Main.py")
-        score_upper = _fuzzy_score("MAIN", "main.py")
-        assert score_lower > 100
-        assert score_upper > 100
+        assert _FileIndex(["Main.py"]).search("main") == ["Main.py"]
+        assert _FileIndex(["main.py"]).search("MAIN") == ["main.py"]
 
     def test_shorter_paths_preferred(self):
-        """Shorter paths get slightly higher scores for same match."""
-        short_score = _fuzzy_score("test", "test.py")
-        long_score = _fuzzy_score("test", "very/long/path/to/test.py")
-        assert short_score > long_score
+        """Shorter paths win ties between matches of the same kind."""
+        results = _FileIndex(["very/long/path/to/test.py", "test.py"]).search("test")
+        assert results == ["test.py", "very/long/path/to/test.py"]
+
+    def test_substring_matches_ranked_above_fuzzy_matches(self):
+        """Similar filenames only fill the slots left after substring matches."""
+        results = _FileIndex(["src/tset.py", "src/other.py", "src/test.py"]).search("test")
+        assert results == ["src/test.py", "src/tset.py"]
+
+    def test_fuzzy_matches_respect_limit(self):
+        """Fuzzy matches never push the result count past the limit."""
+        index = _FileIndex(["test.py", "tset.py", "tests.py", "tst.py"])
+        assert index.search("test", limit=2) == ["test.py", "tests.py"]
 
 
-class TestFuzzySearch:
-    """Tests for the _fuzzy_search function."""
+class TestSearch:
+    """Tests for _FileIndex.search filtering and limits."""
 
     @pytest.fixture
-    def sample_files(self):
+    def sample_files(self) -> list[str]:
         """Sample file list for testing."""
         return [
             "README.md",
@@ -80,45 +89,119 @@ class TestFuzzySearch:
             "docs/api.md",
         ]
 
-    def test_empty_query_returns_root_files_first(self, sample_files):
+    def test_empty_query_returns_root_files_first(self, sample_files: list[str]):
         """Empty query returns files sorted by depth, then name."""
-        results = _fuzzy_search("", sample_files, limit=5)
+        results = _FileIndex(sample_files).search("", limit=5)
         # Root level files should come first
         assert results[0] in ["README.md", "setup.py"]
         assert all("/" not in r for r in results[:2])  # First items are root level
 
-    def test_exact_match_ranked_first(self, sample_files):
+    def test_exact_match_ranked_first(self, sample_files: list[str]):
         """Exact filename matches are ranked first."""
-        results = _fuzzy_search("main", sample_files, limit=5)
+        results = _FileIndex(sample_files).search("main", limit=5)
         assert "src/main.py" in results[:2]
 
-    def test_filters_dotfiles_by_default(self, sample_files):
+    def test_filters_dotfiles_by_default(self, sample_files: list[str]):
         """Dotfiles are filtered out by default."""
-        results = _fuzzy_search("git", sample_files, limit=10)
+        results = _FileIndex(sample_files).search("git", limit=10)
         assert not any(".git" in r for r in results)
 
-    def test_includes_dotfiles_when_query_starts_with_dot(self, sample_files):
+    def test_includes_dotfiles_when_query_starts_with_dot(self, sample_files: list[str]):
         """Dotfiles included when query starts with '.'."""
-        results = _fuzzy_search(".git", sample_files, limit=10, include_dotfiles=True)
+        results = _FileIndex(sample_files).search(".git", limit=10, include_dotfiles=True)
         assert any(".git" in r for r in results)
 
-    def test_respects_limit(self, sample_files):
+    def test_respects_limit(self, sample_files: list[str]):
         """Results respect the limit parameter."""
-        results = _fuzzy_search("", sample_files, limit=3)
+        results = _FileIndex(sample_files).search("", limit=3)
         assert len(results) <= 3
 
-    def test_filters_low_score_matches(self, sample_files):
+    def test_filters_low_score_matches(self, sample_files: list[str]):
         """Low score matches are filtered out."""
-        results = _fuzzy_search("xyznonexistent", sample_files, limit=10)
+        results = _FileIndex(sample_files).search("xyznonexistent", limit=10)
         assert len(results) == 0
 
-    def test_utils_matches_multiple_files(self, sample_files):
+    def test_utils_matches_multiple_files(self, sample_files: list[str]):
         """Query matching multiple files returns all matches."""
-        results = _fuzzy_search("utils", sample_files, limit=10)
+        results = _FileIndex(sample_files).search("utils", limit=10)
         assert len(results) >= 2
         assert any("utils.py" in r for r in results)
 
 
+class TestFileIndex:
+    """Tests for the _FileIndex substring lookup."""
+
+    def test_substring_matches_each_path_once(self):
+        """A path containing the query several times is only reported once."""
+        index = _FileIndex(["utils/utils.py", "main.py", "src/my_utils.py"])
+        assert index._substring_matches("utils") == [0, 2]
+
+    def test_substring_matches_do_not_span_paths(self):
+        """Matches never straddle the boundary between two paths."""
+        index = _FileIndex(["abc", "def"])
+        assert index._substring_matches("cd") == []
+
+    def test_substring_matches_are_case_insensitive(self):
+        """Paths are lowercased when the index is built."""
+        index = _FileIndex(["README.md", "src/Main.py"])
+        assert index._substring_matches("main") == [1]
+
+    def test_extended_query_narrows_previous_matches(self):
+        """Typing more characters narrows the previous matches."""
+        files = ["src/main.py", "src/manifest.json", "docs/map.md", "main.py"]
+        index = _FileIndex(files)
+        assert index._substring_matches("ma") == [0, 1, 2, 3]
+        assert index._substring_matches("mai") == [0, 3]
+        assert index._substring_matches("src") == [0, 1]
+        assert index.search("main") == _FileIndex(files).search("main")
+
+
+class TestScoreFilenameSimilarity:
+    """Tests for the fuzzy filename fallback used by _FileIndex.search."""
+
+    def test_matches_unpruned_ratio(self):
+        """Pruning never changes which filenames pass or their order."""
+        filenames = ["mian.py", "main.rs", "domain.py", "readme.md", "mn.txt", "a.py", "mai"]
+        expected = sorted(
+            (
+                i
+                for i, name in enumerate(filenames)
+                if SequenceMatcher(None, "main.py", name).ratio() >= 0.5
+            ),
+            key=lambda i: -SequenceMatcher(None, "main.py", filenames[i]).ratio(),
+        )
+        result = _score_filename_similarity("main.py", filenames, range(len(filenames)), 10)
+        assert result == expected
+
+    def test_quick_bounds_skip_full_ratio(self, monkeypatch: pytest.MonkeyPatch):
+        """Filenames rejected by the cheap upper bounds never run ratio()."""
+        ratio_calls: list[str] = []
+
+        class CountingMatcher(SequenceMatcher):
+            def ratio(self) -> float:
+                ratio_calls.append(self.b)
+                return super().ratio()
+
+        monkeypatch.setattr("deepagents_cli.widgets.autocomplete.SequenceMatcher", CountingMatcher)
+        filenames = ["mian.py", "zzzzzzzzzzzzzzzzzzzz.md", "x", "qqqq.js"]
+        assert _score_filename_similarity("main.py", filenames, range(4), 10) == [0]
+        assert ratio_calls == ["mian.py"]
+
+    def test_repeated_filenames_scored_once(self, monkeypatch: pytest.MonkeyPatch):
+        """Each distinct filename is only scored once per query."""
+        ratio_calls: list[str] = []
+
+        class CountingMatcher(SequenceMatcher):
+            def ratio(self) -> float:
+                ratio_calls.append(self.b)
+                return super().ratio()
+
+        monkeypatch.setattr("deepagents_cli.widgets.autocomplete.SequenceMatcher", CountingMatcher)
+        filenames = ["mian.py", "mian.py", "mian.py"]
+        assert _score_filename_similarity("main.py", filenames, range(3), 10) == [0, 1, 2]
+        assert ratio_calls == ["mian.py"]
+
+
 class TestHelperFunctions:
     """Tests for helper functions."""
 
@@ -141,11 +224,24 @@ class TestHelperFunctions:
         assert _path_depth("src/utils/file.py") == 2
         assert _path_depth("a/b/c/d/file.py") == 4
 
+    def test_file_type_hint_uses_extension(self):
+        """_file_type_hint returns the lowercased extension of the filename."""
+        assert _file_type_hint("src/main.py") == "py"
+        assert _file_type_hint("docs/README.MD") == "md"
+        assert _file_type_hint("archive.tar.gz") == "gz"
+
+    def test_file_type_hint_without_extension(self):
+        """_file_type_hint falls back to "file" when there is no extension."""
+        assert _file_type_hint("Makefile") == "file"
+        assert _file_type_hint("config/.env") == "file"
+        assert _file_type_hint("v1.0/notes") == "file"
+        assert _file_type_hint("trailing.") == "file"
+
 
 class TestFindProjectRoot:
     """Tests for _find_project_root function."""
 
-    def test_finds_git_root(self, tmp_path):
+    def test_finds_git_root(self, tmp_path: Path):
         """Finds .git directory and returns its parent."""
         # Create nested structure with .git at root
         git_dir = tmp_path / ".git"
@@ -156,7 +252,7 @@ class TestFindProjectRoot:
         result = _find_project_root(nested)
         assert result == tmp_path
 
-    def test_returns_start_path_when_no_git(self, tmp_path):
+    def test_returns_start_path_when_no_git(self, tmp_path: Path):
         """Returns start path when no .git found."""
         nested = tmp_path / "some" / "path"
         nested.mkdir(parents=True)
@@ -165,7 +261,7 @@ class TestFindProjectRoot:
         # Should return the path itself (or a parent) since no .git exists
         assert result == nested or nested.is_relative_to(result)
 
-    def test_handles_root_level_git(self, tmp_path):
+    def test_handles_root_level_git(self, tmp_path: Path):
         """Handles .git at the start path itself."""
         git_dir = tmp_path / ".git"
         git_dir.mkdir()
@@ -174,33 +270,81 @@ class TestFindProjectRoot:
         assert result == tmp_path
 
 
+class TestWalkProjectFiles:
+    """Tests for the non-git file listing fallback."""
+
+    def test_lists_files_breadth_first(self, tmp_path: Path):
+        """Shallower files come before deeper ones, using / separators."""
+        (tmp_path / "src" / "pkg").mkdir(parents=True)
+        (tmp_path / "src" / "pkg" / "mod.py").write_text("")
+        (tmp_path / "src" / "main.py").write_text("")
+        (tmp_path / "README.md").write_text("")
+
+        assert _walk_project_files(tmp_path) == ["README.md", "src/main.py", "src/pkg/mod.py"]
+
+    def test_skips_hidden_entries(self, tmp_path: Path):
+        """Dotfiles and everything under dot-directories are skipped."""
+        (tmp_path / ".hidden").mkdir()
+        (tmp_path / ".hidden" / "secret.py").write_text("")
+        (tmp_path / ".env").write_text("")
+        (tmp_path / "visible.py").write_text("")
+
+        assert _walk_project_files(tmp_path) == ["visible.py"]
+
+    def test_limits_depth(self, tmp_path: Path):
+        """Files more than four path components deep are not listed."""
+        deep = tmp_path / "a" / "b" / "c" / "d"
+        deep.mkdir(parents=True)
+        (deep / "too_deep.py").write_text("")
+        (deep.parent / "ok.py").write_text("")
+
+        assert _walk_project_files(tmp_path) == ["a/b/c/ok.py"]
+
+
+class TestGetProjectFiles:
+    """Tests for listing tracked files with git."""
+
+    def test_returns_unquoted_paths(self, tmp_path: Path):
+        """Paths with spaces and non-ASCII characters come back as-is."""
+        if shutil.which("git") is None:
+            pytest.skip("git not available")
+        (tmp_path / "docs").mkdir()
+        (tmp_path / "docs" / "my notes.md").write_text("")
+        (tmp_path / "résumé.txt").write_text("")
+        subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)  # noqa: S607
+        subprocess.run(["git", "add", "."], cwd=tmp_path, check=True)  # noqa: S607
+
+        assert sorted(_get_project_files(tmp_path)) == ["docs/my notes.md", "résumé.txt"]
+
+
 class TestSlashCommandController:
     """Tests for SlashCommandController."""
 
     @pytest.fixture
     def mock_view(self):
         """Create a mock CompletionView."""
-        view = MagicMock()
-        return view
+        return MagicMock()
 
     @pytest.fixture
-    def controller(self, mock_view):
+    def controller(self, mock_view: MagicMock):
         """Create a SlashCommandController with mock view."""
         return SlashCommandController(SLASH_COMMANDS, mock_view)
 
-    def test_can_handle_slash_prefix(self, controller):
+    def test_can_handle_slash_prefix(self, controller: SlashCommandController):
         """Handles text starting with /."""
         assert controller.can_handle("/", 1) is True
         assert controller.can_handle("/hel", 4) is True
         assert controller.can_handle("/help", 5) is True
 
-    def test_cannot_handle_non_slash(self, controller):
+    def test_cannot_handle_non_slash(self, controller: SlashCommandController):
         """Does not handle text not starting with /."""
         assert controller.can_handle("hello", 5) is False
         assert controller.can_handle("", 0) is False
         assert controller.can_handle("test /cmd", 9) is False
 
-    def test_filters_commands_by_prefix(self, controller, mock_view):
+    def test_filters_commands_by_prefix(
+        self, controller: SlashCommandController, mock_view: MagicMock
+    ):
         """Filters commands based on typed prefix."""
         controller.on_text_changed("/hel", 4)
 
@@ -209,7 +353,9 @@ class TestSlashCommandController:
         suggestions = mock_view.render_completion_suggestions.call_args[0][0]
         assert any("/help" in s[0] for s in suggestions)
 
-    def test_filters_version_command_by_prefix(self, controller, mock_view):
+    def test_filters_version_command_by_prefix(
+        self, controller: SlashCommandController, mock_view: MagicMock
+    ):
         """Filters /version command based on typed prefix."""
         controller.on_text_changed("/ver", 4)
 
@@ -217,7 +363,9 @@ class TestSlashCommandController:
         suggestions = mock_view.render_completion_suggestions.call_args[0][0]
         assert any("/version" in s[0] for s in suggestions)
 
-    def test_shows_all_commands_on_slash_only(self, controller, mock_view):
+    def test_shows_all_commands_on_slash_only(
+        self, controller: SlashCommandController, mock_view: MagicMock
+    ):
         """Shows all commands when just / is typed."""
         controller.on_text_changed("/", 1)
 
@@ -225,7 +373,7 @@ class TestSlashCommandController:
         suggestions = mock_view.render_completion_suggestions.call_args[0][0]
         assert len(suggestions) == len(SLASH_COMMANDS)
 
-    def test_clears_on_no_match(self, controller, mock_view):
+    def test_clears_on_no_match(self, controller: SlashCommandController, mock_view: MagicMock):
         """Clears suggestions when no commands match after having suggestions."""
         # First get some suggestions
         controller.on_text_changed("/h", 2)
@@ -235,7 +383,7 @@ class TestSlashCommandController:
         controller.on_text_changed("/xyz", 4)
         mock_view.clear_completion_suggestions.assert_called()
 
-    def test_reset_clears_state(self, controller, mock_view):
+    def test_reset_clears_state(self, controller: SlashCommandController, mock_view: MagicMock):
         """Reset clears suggestions and state."""
         controller.on_text_changed("/h", 2)
         controller.reset()
@@ -252,42 +400,104 @@ class TestFuzzyFileControllerCanHandle:
         return MagicMock()
 
     @pytest.fixture
-    def controller(self, mock_view, tmp_path):
+    def controller(self, mock_view: MagicMock, tmp_path: Path):
         """Create a FuzzyFileController."""
         return FuzzyFileController(mock_view, cwd=tmp_path)
 
-    def test_handles_at_symbol(self, controller):
+    def test_handles_at_symbol(self, controller: FuzzyFileController):
         """Handles text with @ symbol."""
         assert controller.can_handle("@", 1) is True
         assert controller.can_handle("@file", 5) is True
         assert controller.can_handle("look at @src/main.py", 20) is True
 
-    def test_handles_at_mid_text(self, controller):
+    def test_handles_at_mid_text(self, controller: FuzzyFileController):
         """Handles @ in middle of text."""
         assert controller.can_handle("check @file", 11) is True
         assert controller.can_handle("see @", 5) is True
 
-    def test_no_handle_without_at(self, controller):
+    def test_no_handle_without_at(self, controller: FuzzyFileController):
         """Does not handle text without @."""
         assert controller.can_handle("hello", 5) is False
         assert controller.can_handle("", 0) is False
 
-    def test_no_handle_at_after_cursor(self, controller):
+    def test_no_handle_at_after_cursor(self, controller: FuzzyFileController):
         """Does not handle @ that's after cursor position."""
         assert controller.can_handle("hello @file", 5) is False
 
-    def test_no_handle_space_after_at(self, controller):
+    def test_no_handle_space_after_at(self, controller: FuzzyFileController):
         """Does not handle @ followed by space before cursor."""
         assert controller.can_handle("@ file", 6) is False
         assert controller.can_handle("@file name", 10) is False
 
-    def test_invalid_cursor_positions(self, controller):
+    def test_invalid_cursor_positions(self, controller: FuzzyFileController):
         """Handles invalid cursor positions gracefully."""
         assert controller.can_handle("@file", 0) is False
         assert controller.can_handle("@file", -1) is False
         assert controller.can_handle("@file", 100) is False
 
 
+class TestFuzzyFileControllerLoading:
+    """Tests for background loading of the project file list."""
+
+    def test_loads_synchronously_without_event_loop(self, tmp_path: Path):
+        """Without a running loop, files are loaded on first use."""
+        (tmp_path / "main.py").write_text("")
+        mock_view = MagicMock()
+        controller = FuzzyFileController(mock_view, cwd=tmp_path)
+
+        controller.on_text_changed("@main", 5)
+
+        suggestions = mock_view.render_completion_suggestions.call_args[0][0]
+        assert suggestions == [("@main.py", "py")]
+
+    @pytest.mark.asyncio
+    async def test_replays_input_once_background_load_finishes(self, tmp_path: Path):
+        """Input typed while files load is answered when the load completes."""
+        (tmp_path / "main.py").write_text("")
+        mock_view = MagicMock()
+        controller = FuzzyFileController(mock_view, cwd=tmp_path)
+        loading = controller._loading
+        assert loading is not None
+
+        controller.on_text_changed("@main", 5)
+        await loading
+        await asyncio.sleep(0)
+
+        suggestions = mock_view.render_completion_suggestions.call_args[0][0]
+        assert suggestions == [("@main.py", "py")]
+
+    @pytest.mark.asyncio
+    async def test_reset_drops_pending_input(self, tmp_path: Path):
+        """Input abandoned before the load completes is not replayed."""
+        (tmp_path / "main.py").write_text("")
+        mock_view = MagicMock()
+        controller = FuzzyFileController(mock_view, cwd=tmp_path)
+        loading = controller._loading
+        assert loading is not None
+
+        controller.on_text_changed("@main", 5)
+        controller.reset()
+        await loading
+        await asyncio.sleep(0)
+
+        mock_view.render_completion_suggestions.assert_not_called()
+
+    def test_reloads_when_project_files_change(self, tmp_path: Path):
+        """Files added after the cache was loaded show up on a later lookup."""
+        (tmp_path / "main.py").write_text("")
+        mock_view = MagicMock()
+        controller = FuzzyFileController(mock_view, cwd=tmp_path)
+        controller.on_text_changed("@", 1)
+
+        (tmp_path / "new_module.py").write_text("")
+        os.utime(tmp_path, ns=(0, 1))
+        controller._last_stale_check = 0.0
+        controller.on_text_changed("@new", 4)
+
+        suggestions = mock_view.render_completion_suggestions.call_args[0][0]
+        assert suggestions == [("@new_module.py", "py")]
+
+
 class TestMultiCompletionManager:
     """Tests for MultiCompletionManager."""
 
@@ -297,30 +507,30 @@ class TestMultiCompletionManager:
         return MagicMock()
 
     @pytest.fixture
-    def manager(self, mock_view, tmp_path):
+    def manager(self, mock_view: MagicMock, tmp_path: Path):
         """Create a MultiCompletionManager with both controllers."""
         slash_ctrl = SlashCommandController(SLASH_COMMANDS, mock_view)
         file_ctrl = FuzzyFileController(mock_view, cwd=tmp_path)
         return MultiCompletionManager([slash_ctrl, file_ctrl])
 
-    def test_activates_slash_controller_for_slash(self, manager):
+    def test_activates_slash_controller_for_slash(self, manager: MultiCompletionManager):
         """Activates slash controller for / prefix."""
         manager.on_text_changed("/help", 5)
         assert manager._active is not None
         assert isinstance(manager._active, SlashCommandController)
 
-    def test_activates_file_controller_for_at(self, manager):
+    def test_activates_file_controller_for_at(self, manager: MultiCompletionManager):
         """Activates file controller for @ prefix."""
         manager.on_text_changed("@file", 5)
         assert manager._active is not None
         assert isinstance(manager._active, FuzzyFileController)
 
-    def test_no_active_for_plain_text(self, manager):
+    def test_no_active_for_plain_text(self, manager: MultiCompletionManager):
         """No controller active for plain text."""
         manager.on_text_changed("hello world", 11)
         assert manager._active is None
 
-    def test_switches_controllers(self, manager):
+    def test_switches_controllers(self, manager: MultiCompletionManager):
         """Switches between controllers as input changes."""
         manager.on_text_changed("/cmd", 4)
         assert isinstance(manager._active, SlashCommandController)
@@ -328,7 +538,7 @@ class TestMultiCompletionManager:
         manager.on_text_changed("@file", 5)
         assert isinstance(manager._active, FuzzyFileController)
 
-    def test_reset_clears_active(self, manager):
+    def test_reset_clears_active(self, manager: MultiCompletionManager):
         """Reset clears active controller."""
         manager.on_text_changed("/cmd", 4)
         manager.reset()
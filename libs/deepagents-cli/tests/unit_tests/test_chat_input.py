@@ -0,0 +1,45 @@
+# Copyright (c) 2025 Harrison Chase
+"""Tests for the chat input widgets."""
+
+import pytest
+from textual.app import App, ComposeResult
+from textual.geometry import Region
+
+from deepagents_cli.widgets.chat_input import CompletionPopup
+
+_SUGGESTIONS = [("/help", "Show help"), ("/clear", "Clear the screen")]
+
+
+class _PopupApp(App):
+    def compose(self) -> ComposeResult:
+        yield CompletionPopup()
+
+
+def _reversed_rows(popup: CompletionPopup) -> list[str]:
+    """Return the rendered text of each row shown in reverse video."""
+    strips = popup.render_lines(Region(0, 0, popup.size.width, len(_SUGGESTIONS)))
+    return [
+        strip.text.strip()
+        for strip in strips
+        if any(segment.style is not None and segment.style.reverse for segment in strip)
+    ]
+
+
+class TestCompletionPopupSelection:
+    """Test moving the selection between completion rows."""
+
+    @pytest.mark.asyncio
+    async def test_moving_selection_moves_the_highlight(self) -> None:
+        """The reverse style leaves the old row and is drawn on the new one."""
+        async with _PopupApp().run_test() as pilot:
+            popup = pilot.app.query_one(CompletionPopup)
+
+            popup.update_suggestions(_SUGGESTIONS, 0)
+            await pilot.pause()
+
+            assert _reversed_rows(popup) == ["/help  Show help"]
+
+            popup.update_suggestions(_SUGGESTIONS, 1)
+            await pilot.pause()
+
+            assert _reversed_rows(popup) == ["/clear  Clear the screen"]
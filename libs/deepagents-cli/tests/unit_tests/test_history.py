@@ -0,0 +1,189 @@
+# Copyright (c) 2025 Harrison Chase
+"""Tests for HistoryManager."""
+
+import asyncio
+import gc
+import json
+import weakref
+from pathlib import Path
+
+import pytest
+from textual.app import App, ComposeResult
+
+from deepagents_cli.widgets.chat_input import ChatInput
+from deepagents_cli.widgets.history import HistoryManager
+
+
+class TestHistoryLoading:
+    """Tests for loading history from file."""
+
+    def test_loads_last_entries(self, tmp_path: Path):
+        """Only the most recent max_entries entries are kept."""
+        history_file = tmp_path / "history.jsonl"
+        history_file.write_text("".join(json.dumps(f"cmd {i}") + "\n" for i in range(50)))
+
+        manager = HistoryManager(history_file, max_entries=3)
+
+        assert manager._entries == ["cmd 47", "cmd 48", "cmd 49"]
+
+    def test_loads_entries_longer_than_tail_estimate(self, tmp_path: Path):
+        """Long entries at the end of the file are read whole."""
+        history_file = tmp_path / "history.jsonl"
+        long_entries = ["a" * 5000, "b" * 5000]
+        history_file.write_text("".join(json.dumps(e) + "\n" for e in ["short", *long_entries]))
+
+        manager = HistoryManager(history_file, max_entries=2)
+
+        assert manager._entries == long_entries
+
+    def test_keeps_plain_text_lines(self, tmp_path: Path):
+        """Lines that aren't JSON strings are kept as-is; blank lines are skipped."""
+        history_file = tmp_path / "history.jsonl"
+        history_file.write_text('"first"\n\nplain command\n"quote \\" inside"\n')
+
+        manager = HistoryManager(history_file)
+
+        assert manager._entries == ["first", "plain command", 'quote " inside']
+
+    def test_non_string_json_lines_load_as_text(self, tmp_path: Path):
+        """Other JSON values are loaded as their string form, as before."""
+        history_file = tmp_path / "history.jsonl"
+        history_file.write_text('null\ntrue\n{"a": 1}\n  "padded"\n')
+
+        manager = HistoryManager(history_file)
+
+        assert manager._entries == ["None", "True", "{'a': 1}", "padded"]
+
+
+class TestHistoryWriting:
+    """Tests for writing history entries to file."""
+
+    def test_batches_entries_added_in_quick_succession(self, tmp_path: Path):
+        """The first entry is written right away; a quick follow-up waits for flush()."""
+        history_file = tmp_path / "history.jsonl"
+        manager = HistoryManager(history_file)
+
+        manager.add("first")
+        manager.add("second")
+
+        assert history_file.read_text() == '"first"\n'
+
+        manager.flush()
+
+        assert history_file.read_text() == '"first"\n"second"\n'
+        assert HistoryManager(history_file)._entries == ["first", "second"]
+
+    def test_reopens_file_after_compaction(self, tmp_path: Path):
+        """Entries appended after a compaction land in the rewritten file."""
+        history_file = tmp_path / "history.jsonl"
+        manager = HistoryManager(history_file, max_entries=2)
+
+        for i in range(6):
+            manager.add(f"cmd {i}")
+        manager.close()
+
+        assert HistoryManager(history_file, max_entries=10)._entries == ["cmd 3", "cmd 4", "cmd 5"]
+        assert [p.name for p in tmp_path.iterdir()] == ["history.jsonl"]
+
+    def test_keeps_writing_after_another_manager_compacts(self, tmp_path: Path):
+        """A manager with an open handle writes to the file another one swapped in."""
+        history_file = tmp_path / "history.jsonl"
+        compacting = HistoryManager(history_file, max_entries=2)
+        other = HistoryManager(history_file, max_entries=2)
+
+        other.add("b1")
+        for i in range(5):
+            compacting.add(f"a{i}")
+        other.add("b2")
+        other.add("b3")
+        other.flush()
+
+        assert HistoryManager(history_file, max_entries=10)._entries == ["a3", "a4", "b2", "b3"]
+
+    def test_close_writes_to_file_another_manager_just_compacted(self, tmp_path: Path):
+        """Entries buffered right after another manager compacts are not lost on close."""
+        history_file = tmp_path / "history.jsonl"
+        writer = HistoryManager(history_file, max_entries=2)
+        compacting = HistoryManager(history_file, max_entries=2)
+
+        writer.add("a0")
+        for i in range(5):
+            compacting.add(f"b{i}")
+        writer.add("a1")
+        writer.close()
+
+        assert HistoryManager(history_file, max_entries=10)._entries == ["b3", "b4", "a1"]
+
+
+class TestHistoryLifetime:
+    """Tests for closing history managers."""
+
+    def test_manager_is_not_kept_alive(self, tmp_path: Path):
+        """Nothing holds on to a manager once its owner drops it."""
+        manager = HistoryManager(tmp_path / "history.jsonl")
+        manager.add("first")
+        ref = weakref.ref(manager)
+
+        del manager
+        gc.collect()
+
+        assert ref() is None
+
+
+class _ChatInputApp(App):
+    def __init__(self, history_file: Path) -> None:
+        super().__init__()
+        self._history_file = history_file
+
+    def compose(self) -> ComposeResult:
+        yield ChatInput(cwd=self._history_file.parent, history_file=self._history_file)
+
+
+class TestChatInputHistoryFlush:
+    """Tests for how the chat input gets buffered entries written."""
+
+    @pytest.mark.asyncio
+    async def test_buffered_entry_is_written_after_delay(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """An entry held back by batching reaches the file without another add."""
+        monkeypatch.setattr(HistoryManager, "flush_interval", 0.05)
+        history_file = tmp_path / "history.jsonl"
+        async with _ChatInputApp(history_file).run_test() as pilot:
+            chat_input = pilot.app.query_one(ChatInput)
+
+            chat_input._add_to_history("first")
+            chat_input._add_to_history("second")
+            assert history_file.read_text() == '"first"\n'
+
+            await asyncio.sleep(0.2)
+
+            assert history_file.read_text() == '"first"\n"second"\n'
+
+    @pytest.mark.asyncio
+    async def test_buffered_entry_is_written_on_unmount(self, tmp_path: Path):
+        """Entries still buffered when the input goes away are written and the file closed."""
+        history_file = tmp_path / "history.jsonl"
+        async with _ChatInputApp(history_file).run_test() as pilot:
+            chat_input = pilot.app.query_one(ChatInput)
+            chat_input._add_to_history("first")
+            chat_input._add_to_history("second")
+
+        assert history_file.read_text() == '"first"\n"second"\n'
+        assert chat_input._history._file is None
+
+
+class TestHistoryNavigation:
+    """Tests for navigating history entries."""
+
+    def test_prefix_navigation_skips_other_entries(self, tmp_path: Path):
+        """get_previous/get_next only visit entries starting with the prefix."""
+        manager = HistoryManager(tmp_path / "history.jsonl")
+        for entry in ["git status", "ls", "git diff", "pwd", "gh pr list"]:
+            manager.add(entry)
+
+        assert manager.get_previous("", prefix="git") == "git diff"
+        assert manager.get_previous("", prefix="git") == "git status"
+        assert manager.get_previous("", prefix="git") is None
+        assert manager.get_next(prefix="git") == "git diff"
+        assert manager.get_next(prefix="git") == ""
@@ -1,8 +1,12 @@
 """Unit tests for message widgets markup safety."""
 
+import asyncio
+
 import pytest
+from textual.app import App, ComposeResult
 
 from deepagents_cli.widgets.messages import (
+    AssistantMessage,
     ErrorMessage,
     SystemMessage,
     ToolCallMessage,
@@ -84,3 +88,137 @@ class TestToolCallMessageMarkupSafety:
         args = {"code": "arr[0] = val[1]", "file": "test.py"}
         msg = ToolCallMessage("write_file", args)
         assert msg._args == args
+
+
+class _AssistantApp(App):
+    def compose(self) -> ComposeResult:
+        yield AssistantMessage()
+
+
+class TestAssistantMessageStreaming:
+    """Test AssistantMessage streaming."""
+
+    @pytest.mark.asyncio
+    async def test_streamed_chunks_are_written_together(self) -> None:
+        """A burst of chunks reaches the markdown stream as one write."""
+        async with _AssistantApp().run_test() as pilot:
+            msg = pilot.app.query_one(AssistantMessage)
+            for chunk in ["Hello", ", ", "world", "!"]:
+                await msg.append_content(chunk)
+
+            stream = msg._ensure_stream()
+            writes: list[str] = []
+            original_write = stream.write
+
+            async def record_write(fragment: str) -> None:
+                writes.append(fragment)
+                await original_write(fragment)
+
+            stream.write = record_write  # type: ignore[method-assign]
+            await msg.stop_stream()
+
+            assert writes == ["Hello, world!"]
+            assert msg._get_markdown().source == "Hello, world!"
+
+    @pytest.mark.asyncio
+    async def test_whitespace_chunks_wait_for_visible_text(self) -> None:
+        """Whitespace-only chunks aren't written until more text arrives."""
+        async with _AssistantApp().run_test() as pilot:
+            msg = pilot.app.query_one(AssistantMessage)
+            await msg.append_content("Hello")
+            await asyncio.sleep(0.2)
+
+            await msg.append_content("\n")
+            await msg.append_content("\n")
+            await asyncio.sleep(0.2)
+            assert msg._get_markdown().source == "Hello"
+
+            await msg.append_content("World")
+            await asyncio.sleep(0.2)
+            assert msg._get_markdown().source == "Hello\n\nWorld"
+
+
+class _ToolCallApp(App):
+    def compose(self) -> ComposeResult:
+        yield ToolCallMessage("bash", {"command": "ls"})
+
+
+class TestToolCallMessageOutput:
+    """Test ToolCallMessage output preview."""
+
+    @pytest.mark.asyncio
+    async def test_long_output_is_previewed_until_expanded(self) -> None:
+        """Output over the preview limit is truncated with a hint until toggled."""
+        async with _ToolCallApp().run_test() as pilot:
+            msg = pilot.app.query_one(ToolCallMessage)
+            output = "\n".join(f"line {i}" for i in range(10))
+            msg.set_success(output)
+            await pilot.pause()
+
+            assert msg._preview is not None
+            assert msg._hint is not None
+            assert msg._full is not None
+            assert str(msg._preview.content) == "line 0\nline 1\nline 2"
+            assert msg._hint.display
+            assert not msg._full.display
+
+            msg.toggle_output()
+            await pilot.pause()
+
+            assert str(msg._full.content) == output
+            assert msg._full.display
+            assert not msg._preview.display
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("short", None),
+            ("a\nb\nc", None),
+            ("a\nb\nc\nd", "a\nb\nc"),
+            ("x" * 201, "x" * 200 + "..."),
+            ("x" * 300 + "\nb\nc\nd", "x" * 200 + "..."),
+        ],
+    )
+    def test_truncated_preview(self, text: str, expected: str | None) -> None:
+        """Preview is cut to the first lines, then to the character limit."""
+        assert ToolCallMessage("bash")._truncated_preview(text) == expected
+
+    @pytest.mark.parametrize(
+        ("tool_name", "args", "expected"),
+        [
+            ("bash", {}, ""),
+            ("bash", {"command": "ls"}, "command='ls'"),
+            ("grep", {"a": 1, "b": 2, "c": 3, "d": 4}, "a=1, b=2, c=3, ..."),
+            (
+                "edit_file",
+                {"file_path": "x.py", "old_string": "a", "new_string": "b"},
+                "file_path='x.py'",
+            ),
+        ],
+    )
+    def test_args_display(self, tool_name: str, args: dict, expected: str) -> None:
+        """Inline args are filtered for file tools and capped at three."""
+        assert ToolCallMessage(tool_name, args)._args_display == expected
+
+    @pytest.mark.asyncio
+    async def test_back_to_back_changes_update_display_once(self) -> None:
+        """Setting the result and expanding it right away renders only once."""
+        async with _ToolCallApp().run_test() as pilot:
+            msg = pilot.app.query_one(ToolCallMessage)
+            updates = 0
+            original_update = msg._update_output_display
+
+            def count_update() -> None:
+                nonlocal updates
+                updates += 1
+                original_update()
+
+            msg._update_output_display = count_update  # type: ignore[method-assign]
+
+            msg.set_success("line 1\nline 2\nline 3\nline 4")
+            msg.toggle_output()
+            await pilot.pause()
+
+            assert updates == 1
+            assert msg._full is not None
+            assert msg._full.display
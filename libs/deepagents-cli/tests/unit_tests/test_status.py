@@ -0,0 +1,122 @@
+# Copyright (c) 2025 Harrison Chase
+"""Tests for the status bar widget."""
+
+import asyncio
+
+import pytest
+from textual.app import App, ComposeResult
+from textual.widgets import Static
+
+from deepagents_cli.widgets.status import StatusBar
+
+
+class _StatusApp(App):
+    def compose(self) -> ComposeResult:
+        yield StatusBar(cwd="/workspace")
+
+
+def _tokens_text(bar: StatusBar) -> str:
+    return str(bar.query_one("#tokens-display", Static).content)
+
+
+class TestStatusBarThrottling:
+    """Test throttling of token and status message updates."""
+
+    @pytest.mark.asyncio
+    async def test_rapid_token_updates_show_first_and_last(self) -> None:
+        """The first count shows immediately, the latest once the interval ends."""
+        async with _StatusApp().run_test() as pilot:
+            bar = pilot.app.query_one(StatusBar)
+
+            bar.set_tokens(500)
+            bar.set_tokens(1500)
+            bar.set_tokens(2500)
+
+            assert _tokens_text(bar) == "500 tokens"
+
+            await asyncio.sleep(0.2)
+
+            assert _tokens_text(bar) == "2.5K tokens"
+
+    @pytest.mark.asyncio
+    async def test_hide_tokens_drops_pending_count(self) -> None:
+        """A throttled count isn't shown after the display is hidden."""
+        async with _StatusApp().run_test() as pilot:
+            bar = pilot.app.query_one(StatusBar)
+
+            bar.set_tokens(500)
+            bar.set_tokens(1500)
+            bar.hide_tokens()
+            await asyncio.sleep(0.2)
+
+            assert _tokens_text(bar) == ""
+
+    @pytest.mark.asyncio
+    async def test_thinking_status_is_highlighted(self) -> None:
+        """Thinking/executing messages get the thinking class."""
+        async with _StatusApp().run_test() as pilot:
+            bar = pilot.app.query_one(StatusBar)
+            message = bar.query_one("#status-message", Static)
+
+            bar.set_status_message("Agent is thinking...")
+            assert message.has_class("thinking")
+
+            await asyncio.sleep(0.2)
+            bar.set_status_message("Ready")
+            assert not message.has_class("thinking")
+            assert str(message.content) == "Ready"
+
+    @pytest.mark.asyncio
+    async def test_same_token_text_is_not_redrawn(self) -> None:
+        """Counts that format to the shown text don't update the display."""
+        async with _StatusApp().run_test() as pilot:
+            bar = pilot.app.query_one(StatusBar)
+            display = bar.query_one("#tokens-display", Static)
+
+            bar.set_tokens(1510)
+            await asyncio.sleep(0.2)
+            updates: list[object] = []
+            original_update = display.update
+
+            def record_update(content: object = "") -> None:
+                updates.append(content)
+                original_update(content)
+
+            display.update = record_update  # type: ignore[method-assign]
+
+            bar.set_tokens(1520)
+            await asyncio.sleep(0.2)
+
+            assert updates == []
+            assert _tokens_text(bar) == "1.5K tokens"
+
+
+class TestStatusBarIndicators:
+    """Test the mode and auto-approve indicators."""
+
+    @pytest.mark.asyncio
+    async def test_mode_indicator_has_only_current_mode_class(self) -> None:
+        """Switching modes replaces the previous mode class."""
+        async with _StatusApp().run_test() as pilot:
+            bar = pilot.app.query_one(StatusBar)
+            indicator = bar.query_one("#mode-indicator", Static)
+
+            bar.set_mode("bash")
+            bar.set_mode("command")
+
+            assert indicator.has_class("command")
+            assert not indicator.has_class("bash")
+            assert not indicator.has_class("normal")
+            assert str(indicator.content) == "CMD"
+
+    @pytest.mark.asyncio
+    async def test_auto_approve_indicator(self) -> None:
+        """The auto-approve indicator switches between on and off."""
+        async with _StatusApp().run_test() as pilot:
+            bar = pilot.app.query_one(StatusBar)
+            indicator = bar.query_one("#auto-approve-indicator", Static)
+
+            bar.set_auto_approve(enabled=True)
+
+            assert indicator.has_class("on")
+            assert not indicator.has_class("off")
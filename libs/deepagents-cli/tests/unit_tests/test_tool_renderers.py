@@ -0,0 +1,23 @@
+# Copyright (c) 2025 Harrison Chase
+"""Tests for tool approval renderers."""
+
+from deepagents_cli.widgets.tool_renderers import (
+    BashRenderer,
+    EditFileRenderer,
+    ToolRenderer,
+    get_renderer,
+)
+
+
+class TestGetRenderer:
+    """Test renderer lookup by tool name."""
+
+    def test_known_tools_get_their_renderer(self) -> None:
+        """Registered tools map to their renderer, shared between calls."""
+        assert isinstance(get_renderer("edit_file"), EditFileRenderer)
+        assert isinstance(get_renderer("shell"), BashRenderer)
+        assert get_renderer("bash") is get_renderer("bash")
+
+    def test_unknown_tools_get_the_generic_renderer(self) -> None:
+        """Unregistered tools fall back to the base renderer."""
+        assert type(get_renderer("some_tool")) is ToolRenderer
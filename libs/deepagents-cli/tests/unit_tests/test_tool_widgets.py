@@ -0,0 +1,96 @@
+# Copyright (c) 2025 Harrison Chase
+"""Tests for tool approval widgets."""
+
+import pytest
+from rich.text import Text
+from textual.widgets import Static
+
+from deepagents_cli.widgets.tool_widgets import EditFileApprovalWidget, GenericApprovalWidget
+
+
+class TestGenericApproval:
+    """Test the fallback display for tools without their own widget."""
+
+    def test_args_share_one_widget(self) -> None:
+        """Non-None args are listed in one Static, long values cut, markup shown as-is."""
+        data = {"path": "[b]x[/b]", "skip": None, "body": "z" * 250}
+        widgets = list(GenericApprovalWidget(data).compose())
+
+        assert len(widgets) == 1
+        assert widgets[0].content.plain.split("\n") == [
+            "path: [b]x[/b]",
+            f"body: {'z' * 200}... (50 more chars)",
+        ]
+
+    def test_no_args_shows_nothing(self) -> None:
+        """Nothing is shown when every arg is None."""
+        assert list(GenericApprovalWidget({"a": None}).compose()) == []
+
+
+class TestEditFileDiffLines:
+    """Test rendering of individual diff lines."""
+
+    @pytest.mark.parametrize(
+        ("line", "text", "style"),
+        [
+            ("-old", "- old", "red on #3d1f1f"),
+            ("+new", "+ new", "green on #1f3d1f"),
+            (" same", "  same", "dim"),
+            ("+", "+ ", "green on #1f3d1f"),
+            ("+x[0]", "+ x[0]", "green on #1f3d1f"),
+            ("-[b]x\\", "- [b]x\\", "red on #3d1f1f"),
+        ],
+    )
+    def test_marked_lines_are_styled(self, line: str, text: str, style: str) -> None:
+        """Lines with a diff marker are styled; their content is shown verbatim."""
+        rendered = EditFileApprovalWidget({})._render_diff_line(line)
+        assert rendered == Text.styled(text, style)
+
+    def test_unmarked_lines_are_plain(self) -> None:
+        """Other non-empty lines are shown without markup; empty ones are dropped."""
+        rendered = EditFileApprovalWidget({})._render_diff_line("\\ No newline [x]")
+        assert rendered == Text("\\ No newline [x]")
+        assert EditFileApprovalWidget({})._render_diff_line("") is None
+
+
+class TestEditFileStats:
+    """Test counting of additions and deletions."""
+
+    def test_counts_diff_lines_skipping_headers(self) -> None:
+        """Added and removed lines are counted; file headers are not."""
+        diff_lines = ["--- before", "+++ after", "@@ -1,2 +1,2 @@", " a", "-b", "+c", "+d"]
+        assert EditFileApprovalWidget({})._count_stats(diff_lines, "", "") == (2, 1)
+
+    def test_counts_string_lines_without_diff(self) -> None:
+        """Without a diff, every old line is removed and every new line added."""
+        assert EditFileApprovalWidget({})._count_stats([], "a\nb", "c") == (1, 2)
+
+
+class TestEditFileStringLines:
+    """Test the old/new string preview used when there is no diff."""
+
+    def test_long_strings_are_cut_with_remaining_count(self) -> None:
+        """Only the first preview lines are shown, followed by a count of the rest."""
+        text = "\n".join(f"line {i}" for i in range(25))
+        widgets = list(EditFileApprovalWidget({})._render_string_lines(text, is_addition=False))
+
+        assert len(widgets) == 1
+        lines = widgets[0].content.split("\n")
+        assert len(lines) == 21
+        assert lines[0] == Text.styled("- line 0", "red on #3d1f1f")
+        assert lines[-1] == Text.styled("... (5 more lines)", "dim")
+
+
+class TestEditFileDiffWidgets:
+    """Test how the diff is laid out in widgets."""
+
+    def test_diff_lines_share_one_widget(self) -> None:
+        """The whole diff is shown in a single Static, capped at the line limit."""
+        diff_lines = ["@@ -1,60 +1,60 @@", *(f"+line {i}" for i in range(60))]
+        widgets = list(EditFileApprovalWidget({})._render_diff_lines_only(diff_lines))
+
+        assert len(widgets) == 1
+        assert isinstance(widgets[0], Static)
+        lines = widgets[0].content.plain.split("\n")
+        assert len(lines) == 51
+        assert lines[-1] == "... (11 more lines)"
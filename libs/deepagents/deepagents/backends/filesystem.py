@@ -32,6 +32,26 @@ from deepagents.backends.utils import (
 )
 
 
+def _dir_entry_info(entry: os.DirEntry[str], path: str, *, is_dir: bool) -> FileInfo:
+    """Build the listing info for a directory entry.
+
+    Directories get a trailing / and size 0. Size and modification time are
+    left out if the entry can't be stat'ed.
+    """
+    if is_dir:
+        path += "/"
+    try:
+        st = entry.stat()
+    except OSError:
+        return {"path": path, "is_dir": is_dir}
+    return {
+        "path": path,
+        "is_dir": is_dir,
+        "size": 0 if is_dir else int(st.st_size),
+        "modified_at": datetime.fromtimestamp(st.st_mtime).isoformat(),
+    }
+
+
 class FilesystemBackend(BackendProtocol):
     """Backend that reads and writes files directly from the filesystem.
 
@@ -108,46 +128,27 @@ class FilesystemBackend(BackendProtocol):
         if not cwd_str.endswith("/"):
             cwd_str += "/"
 
-        # List only direct children (non-recursive)
+        # List only direct children (non-recursive). scandir entries know their
+        # type from the directory listing and cache stat(), so each child costs
+        # one stat call instead of three.
         try:
-            for child_path in dir_path.iterdir():
-                try:
-                    is_file = child_path.is_file()
-                    is_dir = child_path.is_dir()
-                except OSError:
-                    continue
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    try:
+                        is_file = entry.is_file()
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        continue
+                    if not is_file and not is_dir:
+                        continue
 
-                abs_path = str(child_path)
+                    abs_path = entry.path
+
+                    if not self.virtual_mode:
+                        # Non-virtual mode: use absolute paths
+                        results.append(_dir_entry_info(entry, abs_path, is_dir=is_dir))
+                        continue
 
-                if not self.virtual_mode:
-                    # Non-virtual mode: use absolute paths
-                    if is_file:
-                        try:
-                            st = child_path.stat()
-                            results.append(
-                                {
-                                    "path": abs_path,
-                                    "is_dir": False,
-                                    "size": int(st.st_size),
-                                    "modified_at": datetime.fromtimestamp(st.st_mtime).isoformat(),
-                                }
-                            )
-                        except OSError:
-                            results.append({"path": abs_path, "is_dir": False})
-                    elif is_dir:
-                        try:
-                            st = child_path.stat()
-                            results.append(
-                                {
-                                    "path": abs_path + "/",
-                                    "is_dir": True,
-                                    "size": 0,
-                                    "modified_at": datetime.fromtimestamp(st.st_mtime).isoformat(),
-                                }
-                            )
-                        except OSError:
-                            results.append({"path": abs_path + "/", "is_dir": True})
-                else:
                     # Virtual mode: strip cwd prefix
                     if abs_path.startswith(cwd_str):
                         relative_path = abs_path[len(cwd_str) :]
@@ -158,34 +159,7 @@ class FilesystemBackend(BackendProtocol):
                         # Path is outside cwd, return as-is or skip
                         relative_path = abs_path
 
-                    virt_path = "/" + relative_path
-
-                    if is_file:
-                        try:
-                            st = child_path.stat()
-                            results.append(
-                                {
-                                    "path": virt_path,
-                                    "is_dir": False,
-                                    "size": int(st.st_size),
-                                    "modified_at": datetime.fromtimestamp(st.st_mtime).isoformat(),
-                                }
-                            )
-                        except OSError:
-                            results.append({"path": virt_path, "is_dir": False})
-                    elif is_dir:
-                        try:
-                            st = child_path.stat()
-                            results.append(
-                                {
-                                    "path": virt_path + "/",
-                                    "is_dir": True,
-                                    "size": 0,
-                                    "modified_at": datetime.fromtimestamp(st.st_mtime).isoformat(),
-                                }
-                            )
-                        except OSError:
-                            results.append({"path": virt_path + "/", "is_dir": True})
+                    results.append(_dir_entry_info(entry, "/" + relative_path, is_dir=is_dir))
         except (OSError, PermissionError):
             pass
 
@@ -114,6 +114,12 @@ from langchain_core.runnables import RunnableConfig
 from langgraph.prebuilt import ToolRuntime
 from langgraph.runtime import Runtime
 
+# LibYAML's loader parses frontmatter about 9x faster; PyYAML may be built without it
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 logger = logging.getLogger(__name__)
 
 # Security: Maximum size for SKILL.md files to prevent DoS attacks (10MB)
@@ -224,9 +230,9 @@ def _parse_skill_metadata(
 
     frontmatter_str = match.group(1)
 
-    # Parse YAML using safe_load for proper nested structure support
+    # Parse YAML with a safe loader for proper nested structure support
     try:
-        frontmatter_data = yaml.safe_load(frontmatter_str)
+        frontmatter_data = yaml.load(frontmatter_str, Loader=_SafeLoader)
     except yaml.YAMLError as e:
         logger.warning("Invalid YAML in %s: %s", skill_path, e)
         return None
@@ -1,5 +1,11 @@
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime
 from pathlib import Path
 
+import pytest
+
 from deepagents.backends.filesystem import FilesystemBackend
 from deepagents.backends.protocol import EditResult, WriteResult
 
@@ -489,3 +495,99 @@ def test_filesystem_download_directory_as_file(tmp_path: Path):
     assert responses[0].path == "/mydir"
     assert responses[0].content is None
     assert responses[0].error == "is_directory"
+
+
+def test_filesystem_backend_ls_entry_info(tmp_path: Path):
+    """Test ls_info fills size and modification time for files and directories."""
+    root = tmp_path
+    write_file(root / "a.txt", "hello")
+    (root / "sub").mkdir()
+
+    be = FilesystemBackend(root_dir=str(root), virtual_mode=False)
+    infos = {fi["path"]: fi for fi in be.ls_info(str(root))}
+
+    file_info = infos[str(root / "a.txt")]
+    assert file_info["is_dir"] is False
+    assert file_info["size"] == 5
+    assert datetime.fromisoformat(file_info["modified_at"]).timestamp() == pytest.approx((root / "a.txt").stat().st_mtime)
+
+    dir_info = infos[str(root / "sub") + "/"]
+    assert dir_info["is_dir"] is True
+    assert dir_info["size"] == 0
+    assert "modified_at" in dir_info
+
+
+def test_filesystem_backend_ls_symlinks(tmp_path: Path):
+    """Test ls_info follows symlinks and skips broken ones, in both modes."""
+    root = tmp_path
+    write_file(root / "target.txt", "linked content")
+    (root / "target_dir").mkdir()
+    (root / "file_link").symlink_to(root / "target.txt")
+    (root / "dir_link").symlink_to(root / "target_dir", target_is_directory=True)
+    (root / "dangling").symlink_to(root / "missing.txt")
+    (root / "loop_a").symlink_to(root / "loop_b")
+    (root / "loop_b").symlink_to(root / "loop_a")
+
+    be = FilesystemBackend(root_dir=str(root), virtual_mode=False)
+    infos = {fi["path"]: fi for fi in be.ls_info(str(root))}
+    assert sorted(infos) == [
+        str(root / "dir_link") + "/",
+        str(root / "file_link"),
+        str(root / "target.txt"),
+        str(root / "target_dir") + "/",
+    ]
+    assert infos[str(root / "file_link")]["is_dir"] is False
+    assert infos[str(root / "file_link")]["size"] == len("linked content")
+    assert infos[str(root / "dir_link") + "/"]["is_dir"] is True
+
+    vbe = FilesystemBackend(root_dir=str(root), virtual_mode=True)
+    virtual = {fi["path"]: fi for fi in vbe.ls_info("/")}
+    assert sorted(virtual) == ["/dir_link/", "/file_link", "/target.txt", "/target_dir/"]
+    assert virtual["/file_link"]["size"] == len("linked content")
+    assert virtual["/dir_link/"]["is_dir"] is True
+
+
+class _StatFailingEntry:
+    """Directory entry whose stat() fails, as for an entry removed mid-listing."""
+
+    def __init__(self, entry: os.DirEntry[str]) -> None:
+        self._entry = entry
+        self.name = entry.name
+        self.path = entry.path
+
+    def is_file(self) -> bool:
+        return self._entry.is_file()
+
+    def is_dir(self) -> bool:
+        return self._entry.is_dir()
+
+    def stat(self) -> os.stat_result:
+        msg = "stat failed"
+        raise PermissionError(msg)
+
+
+def test_filesystem_backend_ls_stat_errors(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Test ls_info still lists entries whose stat fails, without size or mtime."""
+    root = tmp_path
+    write_file(root / "a.txt", "hello")
+    (root / "sub").mkdir()
+    real_scandir = os.scandir
+
+    @contextmanager
+    def failing_scandir(path: Path) -> Iterator[list[_StatFailingEntry]]:
+        with real_scandir(path) as entries:
+            yield [_StatFailingEntry(entry) for entry in entries]
+
+    monkeypatch.setattr(os, "scandir", failing_scandir)
+
+    be = FilesystemBackend(root_dir=str(root), virtual_mode=False)
+    assert be.ls_info(str(root)) == [
+        {"path": str(root / "a.txt"), "is_dir": False},
+        {"path": str(root / "sub") + "/", "is_dir": True},
+    ]
+
+    vbe = FilesystemBackend(root_dir=str(root), virtual_mode=True)
+    assert vbe.ls_info("/") == [
+        {"path": "/a.txt", "is_dir": False},
+        {"path": "/sub/", "is_dir": True},
+    ]